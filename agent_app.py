@@ -5,13 +5,15 @@ import os
 # Only include agent endpoint if AGENT_MODE is enabled
 app = FastAPI()
 
-if os.environ.get("AGENT_MODE") == "true":
+AGENT_ENABLED = os.environ.get("AGENT_MODE") == "true"
+
+if AGENT_ENABLED:
     app.include_router(router)
+    _ROOT_RESPONSE = {"message": "Agent mode enabled", "endpoint": "/agent"}
+else:
+    _ROOT_RESPONSE = {"message": "Agent mode disabled"}
 
 
 @app.get("/")
 async def root():
-    if os.environ.get("AGENT_MODE") == "true":
-        return {"message": "Agent mode enabled", "endpoint": "/agent"}
-    else:
-        return {"message": "Agent mode disabled"}
+    return _ROOT_RESPONSE
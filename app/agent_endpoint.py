@@ -5,30 +5,181 @@ managing conversation sessions, and dispatching tool calls with timeout protecti
 """
 
 import asyncio
+import contextlib
+import functools
+import hashlib
+import heapq
+import inspect
+import logging
+import os
 import time
 import random
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote_to_bytes
 from fastapi import APIRouter, Request
-from .agent_runtime import run_thread, ATOMIC_FUNCS
-from .prefilter import clean_message, twiml
+from .agent_runtime import (
+    run_thread,
+    create_seeded_thread,
+    ToolCall,
+    ATOMIC_FUNCS,
+    ATOMIC_FUNC_SET,
+)
+from .prefilter import clean_message, empty_twiml, render_twiml, twiml, twiml_response
+from .aggregator import coalesce
 from .validator_tool import validate_local
+from . import agent_runtime
 from . import tools_atomic as tools
 from .session_manager import SessionManager
+from .session_store import session_store_from_env
 from .session_config.session_config import SessionConfig
 from .timeout_config import timeout_manager
 import structlog
-from typing import Dict, Optional, Tuple, List
+from structlog.contextvars import bind_contextvars, clear_contextvars
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Optional, Tuple, List
 
 router = APIRouter()
 log = structlog.get_logger("agent")
 
-# Feature flag for session manager rollout
-USE_SESSION_MANAGER = True  # Set to False to use legacy _sessions dict
+# Initialize session manager, shared across workers when SESSION_REDIS_URL is set
+_session_config = SessionConfig.from_env()
+_session_store = session_store_from_env(_session_config.ttl_seconds)
+session_manager = SessionManager(_session_config, store=_session_store)
+
+# Dedicated pool for blocking OpenAI calls so slow runs cannot starve the
+# default executor that Starlette uses for sync endpoints and dependencies.
+# Size it to the expected number of concurrent conversations.
+AI_WORKERS = int(os.environ.get("AGENT_AI_WORKERS", "16"))
+_AI_EXECUTOR = ThreadPoolExecutor(max_workers=AI_WORKERS, thread_name_prefix="agent-ai")
+
+_FORM_URLENCODED = "application/x-www-form-urlencoded"
+_MAX_FORM_FIELDS = 50
+
+TIMEOUT_FALLBACK_REPLY = (
+    "I'm processing your request. Please give me a moment and try again shortly."
+)
+ERROR_FALLBACK_REPLY = "I'm having trouble processing your request right now. Please try again."
+_FALLBACK_REPLIES = frozenset({TIMEOUT_FALLBACK_REPLY, ERROR_FALLBACK_REPLY})
+
+RESET_REPLY = (
+    "🚀 Welcome to WhatsPR! I'm your professional press release assistant.\n\n"
+    "I'll help you create a compelling press release through a quick conversation. "
+    "What would you like to announce?\n\n"
+    "📊 Press 1: Funding round\n📦 Press 2: Product launch\n🤝 Press 3: Partnership"
+)
+
+# Fixed replies rendered once; each request only wraps the bytes in a Response
+_RESET_TWIML = render_twiml(RESET_REPLY)
+_SEND_TEXT_TWIML = render_twiml("Please send text.")
+_ERROR_TWIML = render_twiml("Oops, temporary error. Try again.")
+
+# Opening (expires_at, reply, tool_calls) per menu intent; bounded by
+# MENU_SELECTIONS. Entries expire after FIRST_TURN_CACHE_TTL seconds, so a
+# sampled reply is not replayed forever, and the whole cache is dropped when
+# the assistant or its prompt file changes.
+FIRST_TURN_CACHE_TTL = float(os.environ.get("FIRST_TURN_CACHE_TTL", "3600"))
+_FIRST_TURN_CACHE: Dict[str, Tuple[float, str, Tuple[ToolCall, ...]]] = {}
+_first_turn_version: Optional[Tuple[Optional[str], Optional[int]]] = None
+
+# Replies per (thread_id, message) as (expires_at, reply, thread_id), kept
+# RECENT_REPLY_TTL seconds so a re-delivered webhook is answered without a run
+RECENT_REPLY_TTL = 2.0
+_RECENT_REPLIES: Dict[Tuple[str, str], Tuple[float, str, str]] = {}
+
+# Session metrics shared by health endpoints for METRICS_CACHE_TTL seconds,
+# so frequent monitoring scrapes do not each walk every session entry
+METRICS_CACHE_TTL = 1.0
+_metrics_cache: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+
+
+class _PhoneLock:
+    """Per-sender turn lock and the number of requests holding or awaiting it."""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+# Locks exist only while a sender has a request in progress
+_PHONE_LOCKS: Dict[str, _PhoneLock] = {}
+
+# Messages that restart the conversation (compared lowercased). Longer
+# messages cannot match, so they are never lowercased for the check.
+RESET_COMMANDS = frozenset({"reset", "restart", "start over", "menu", "start"})
+_MAX_RESET_COMMAND_LEN = max(map(len, RESET_COMMANDS))
+
+# Numeric menu replies expanded into the intent the assistant expects
+MENU_SELECTIONS = {
+    "1": "I want to announce a funding round",
+    "1️⃣": "I want to announce a funding round",
+    "2": "I want to announce a product launch",
+    "2️⃣": "I want to announce a product launch",
+    "3": "I want to announce a partnership or integration",
+    "3️⃣": "I want to announce a partnership or integration",
+}
+
+
+def hash_phone(phone: str) -> str:
+    """Return a short, stable digest of a phone number for log correlation.
+
+    Args:
+        phone: Sender phone number (e.g. "whatsapp:+15551234567").
+
+    Returns:
+        str: 8 hex characters of a BLAKE2b digest, or "none" if phone is empty.
+    """
+    if not phone:
+        return "none"
+    return hashlib.blake2b(phone.encode(), digest_size=4).hexdigest()
+
+
+def _preview(text: str, limit: int) -> str:
+    """Truncate text for logging, marking truncation with an ellipsis.
+
+    Args:
+        text: Text to preview.
+        limit: Maximum number of characters kept from text.
 
-_sessions: Dict[str, Optional[str]] = {}  # phone -> thread_id (None until first message)
+    Returns:
+        str: text itself if it fits, otherwise its first limit characters plus "...".
+    """
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+async def read_message_fields(request: Request) -> Tuple[str, str]:
+    """Extract the sender and message body from a Twilio webhook.
+
+    Twilio posts application/x-www-form-urlencoded bodies with ~20 fields, of
+    which only From and Body are used. For that content type the raw body is
+    scanned and just those two values are decoded; anything else falls back to
+    Starlette's full form parser. As with the form parser, a repeated field
+    takes its last value.
+
+    Args:
+        request: Incoming webhook request.
 
-# Initialize session manager
-session_manager = SessionManager(SessionConfig())
+    Returns:
+        Tuple of (phone, body), each "" when absent.
+    """
+    if not request.headers.get("content-type", "").startswith(_FORM_URLENCODED):
+        # Webhooks carry no uploads and a few dozen fields at most; the limits
+        # keep a multipart body from spooling files or growing unbounded
+        form = await request.form(max_files=0, max_fields=_MAX_FORM_FIELDS)
+        return str(form.get("From", "")), str(form.get("Body", ""))
+
+    raw = {b"From": b"", b"Body": b""}
+    for pair in (await request.body()).split(b"&"):
+        key, _, value = pair.partition(b"=")
+        if key in raw:
+            raw[key] = value
+    phone, body = (
+        unquote_to_bytes(value.replace(b"+", b" ")).decode("utf-8", "replace")
+        for value in (raw[b"From"], raw[b"Body"])
+    )
+    return phone, body
 
 
 # Timeout configuration now centralized through timeout_manager
@@ -53,9 +204,69 @@ def get_retry_max_delay() -> float:
     return timeout_manager.config.retry_max_delay
 
 
+@functools.lru_cache(maxsize=8)
+def _backoff_schedule(base_delay: float, max_delay: float, max_retries: int) -> Tuple[float, ...]:
+    """Exponential backoff delays (before jitter) for each retry attempt.
+
+    Cached per configuration, so the schedule is only recomputed when the
+    timeout config changes.
+
+    Args:
+        base_delay: Delay before the first retry.
+        max_delay: Upper bound for any single delay.
+        max_retries: Number of retries the schedule covers.
+
+    Returns:
+        Tuple[float, ...]: Delay in seconds indexed by attempt number.
+    """
+    return tuple(min(base_delay * (1 << attempt), max_delay) for attempt in range(max_retries))
+
+
+@contextlib.asynccontextmanager
+async def phone_lock(phone: str):
+    """Serialize conversation turns for one sender within this process.
+
+    The lock entry is dropped as soon as no request for the sender holds or
+    awaits it, so idle senders use no memory.
+
+    Args:
+        phone: Sender phone number.
+
+    Yields:
+        None: While the caller holds the sender's lock.
+    """
+    entry = _PHONE_LOCKS.get(phone)
+    if entry is None:
+        entry = _PHONE_LOCKS[phone] = _PhoneLock()
+    entry.users += 1
+    try:
+        async with entry.lock:
+            yield
+    finally:
+        entry.users -= 1
+        if not entry.users:
+            del _PHONE_LOCKS[phone]
+
+
+def cached_session_metrics() -> Dict[str, Any]:
+    """Return session metrics, recomputed at most every METRICS_CACHE_TTL seconds.
+
+    Returns:
+        Dict[str, Any]: Result of session_manager.get_metrics(). Shared between
+            callers, so it must not be modified.
+    """
+    global _metrics_cache
+    now = time.monotonic()
+    cached_at, metrics = _metrics_cache
+    if metrics is None or now - cached_at > METRICS_CACHE_TTL:
+        metrics = session_manager.get_metrics()
+        _metrics_cache = (now, metrics)
+    return metrics
+
+
 async def run_single_attempt(
     thread_id: Optional[str], user_msg: str, timeout_seconds: float
-) -> Tuple[str, str, List[dict]]:
+) -> Tuple[str, str, List[ToolCall]]:
     """Run a single AI processing attempt with timeout.
 
     Args:
@@ -70,14 +281,18 @@ async def run_single_attempt(
         asyncio.TimeoutError: If the operation times out.
         Exception: If the operation fails for other reasons.
     """
-    loop = asyncio.get_event_loop()
-    task = loop.run_in_executor(None, run_thread, thread_id, user_msg)
-    return await asyncio.wait_for(task, timeout=timeout_seconds)
+    loop = asyncio.get_running_loop()
+    # asyncio.timeout() arms a single loop timer instead of wrapping the
+    # executor future in an extra Task the way wait_for() does.
+    async with asyncio.timeout(timeout_seconds):
+        return await loop.run_in_executor(
+            _AI_EXECUTOR, run_thread, thread_id, user_msg, timeout_seconds
+        )
 
 
 async def run_thread_with_retry(
     thread_id: Optional[str], user_msg: str, timeout_seconds: float = None
-) -> Tuple[str, str, List[dict]]:
+) -> Tuple[str, str, List[ToolCall]]:
     """Run thread with retry logic and timeout protection.
 
     Args:
@@ -88,13 +303,17 @@ async def run_thread_with_retry(
     Returns:
         Tuple of (reply, thread_id, tool_calls) or fallback response on failure.
     """
-    # Use centralized timeout configuration
+    # Snapshot the centralized timeout configuration once so every attempt in
+    # this call sees the same values, even if the config is swapped meanwhile
+    config = timeout_manager.config
     if timeout_seconds is None:
-        timeout_seconds = get_max_ai_processing_time()
+        timeout_seconds = config.ai_processing_timeout
 
-    start_time = time.time()
+    start_time = time.monotonic()
     last_exception = None
-    max_retries = get_max_retries()
+    max_retries = config.retry_max_attempts
+    retry_max_delay = config.retry_max_delay
+    backoff = _backoff_schedule(config.retry_base_delay, retry_max_delay, max_retries)
 
     # Calculate per-attempt timeout (reserve time for retries)
     per_attempt_timeout = timeout_seconds / (max_retries + 1)
@@ -102,7 +321,7 @@ async def run_thread_with_retry(
     for attempt in range(max_retries + 1):
         try:
             # Adjust timeout for remaining time
-            remaining_time = timeout_seconds - (time.time() - start_time)
+            remaining_time = timeout_seconds - (time.monotonic() - start_time)
             attempt_timeout = min(per_attempt_timeout, remaining_time - 0.5)  # Leave 0.5s buffer
 
             if attempt_timeout <= 0:
@@ -122,7 +341,7 @@ async def run_thread_with_retry(
                 thread_id, user_msg, attempt_timeout
             )
 
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             log.info(
                 "ai_success",
                 attempt=attempt + 1,
@@ -134,7 +353,7 @@ async def run_thread_with_retry(
 
         except asyncio.TimeoutError as e:
             last_exception = e
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             log.warning(
                 "ai_attempt_timeout",
                 attempt=attempt + 1,
@@ -144,7 +363,7 @@ async def run_thread_with_retry(
 
         except Exception as e:
             last_exception = e
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             try:
                 log.warning(
                     "ai_attempt_error",
@@ -159,25 +378,24 @@ async def run_thread_with_retry(
             except Exception as log_error:
                 print(f"AI attempt error logging failed: {log_error}, Original error: {e}")
 
-        # Don't retry on the last attempt
-        if attempt < max_retries:
-            # Calculate exponential backoff delay with jitter
-            delay = min(
-                get_retry_base_delay() * (2**attempt) + random.uniform(0, 0.1),
-                get_retry_max_delay(),
-            )
+        # Don't back off after the last attempt; surface the failure now
+        if attempt >= max_retries:
+            break
 
-            # Check if we have time for delay + another attempt
-            remaining_time = timeout_seconds - (time.time() - start_time)
-            if remaining_time > delay + 1.0:  # Need at least 1s for next attempt
-                log.info("ai_retry_delay", delay=delay, remaining_time=remaining_time)
-                await asyncio.sleep(delay)
-            else:
-                log.warning("insufficient_time_for_delay", remaining_time=remaining_time)
-                break
+        # Calculate exponential backoff delay with jitter
+        delay = min(backoff[attempt] + random.random() * 0.1, retry_max_delay)
+
+        # Check if we have time for delay + another attempt
+        remaining_time = timeout_seconds - (time.monotonic() - start_time)
+        if remaining_time <= delay + 1.0:  # Need at least 1s for next attempt
+            log.warning("insufficient_time_for_delay", remaining_time=remaining_time)
+            break
+
+        log.info("ai_retry_delay", delay=delay, remaining_time=remaining_time)
+        await asyncio.sleep(delay)
 
     # All attempts failed - handle gracefully with detailed timeout analysis
-    elapsed = time.time() - start_time
+    elapsed = time.monotonic() - start_time
 
     # Enhanced error logging with more details
     error_summary = str(last_exception) if last_exception else "Unknown error"
@@ -206,24 +424,140 @@ async def run_thread_with_retry(
         timeout_analysis=timeout_analysis,
     )
 
-    # Create thread if needed but preserve existing thread_id on failure
+    # Create thread if needed but preserve existing thread_id on failure. The
+    # call runs on the AI executor so it doesn't block the event loop.
     if thread_id is None:
-        from .agent_runtime import create_thread
-
-        thread_id = create_thread()
+        loop = asyncio.get_running_loop()
+        thread_id = await loop.run_in_executor(_AI_EXECUTOR, agent_runtime.create_thread)
         log.info("thread_created_after_failure", thread_id=thread_id)
 
     # Return appropriate fallback based on the type of failure
     if isinstance(last_exception, asyncio.TimeoutError):
-        fallback_reply = (
-            "I'm processing your request. Please give me a moment and try again shortly."
-        )
+        fallback_reply = TIMEOUT_FALLBACK_REPLY
     else:
-        fallback_reply = "I'm having trouble processing your request right now. Please try again."
+        fallback_reply = ERROR_FALLBACK_REPLY
 
     return fallback_reply, thread_id, []
 
 
+def _check_first_turn_version() -> None:
+    """Empty _FIRST_TURN_CACHE if the assistant or prompt changed since it was filled."""
+    global _first_turn_version
+    version = agent_runtime.assistant_version()
+    if version != _first_turn_version:
+        _FIRST_TURN_CACHE.clear()
+        _first_turn_version = version
+
+
+async def run_first_turn(user_msg: str) -> Tuple[str, str, List[ToolCall]]:
+    """Run the opening exchange of a new session, reusing cached menu replies.
+
+    A new session that starts with a menu selection always gets the same
+    opening from the assistant. The first successful reply per intent is
+    cached; later sessions get a fresh thread seeded with that exchange
+    instead of a full assistant run, until the entry expires or the
+    assistant or prompt changes. Seeding gets one retry attempt's share
+    of the timeout budget; if it fails, the turn falls back to a normal run
+    with the time that is left.
+
+    Args:
+        user_msg: Menu intent text (a value of MENU_SELECTIONS).
+
+    Returns:
+        Tuple of (reply, thread_id, tool_calls).
+    """
+    _check_first_turn_version()
+    cached = _FIRST_TURN_CACHE.get(user_msg)
+    if cached is None or cached[0] <= time.monotonic():
+        reply, thread_id, tool_calls = await run_thread_with_retry(None, user_msg)
+        if thread_id and reply not in _FALLBACK_REPLIES:
+            # The run may have resolved the assistant ID for the first time
+            _check_first_turn_version()
+            _FIRST_TURN_CACHE[user_msg] = (
+                time.monotonic() + FIRST_TURN_CACHE_TTL,
+                reply,
+                tuple(tool_calls),
+            )
+        return reply, thread_id, tool_calls
+
+    _, reply, tool_calls = cached
+    config = timeout_manager.config
+    timeout_seconds = config.ai_processing_timeout
+    start_time = time.monotonic()
+    loop = asyncio.get_running_loop()
+    try:
+        async with asyncio.timeout(timeout_seconds / (config.retry_max_attempts + 1)):
+            thread_id = await loop.run_in_executor(
+                _AI_EXECUTOR,
+                create_seeded_thread,
+                [{"role": "user", "content": user_msg}, {"role": "assistant", "content": reply}],
+            )
+    except Exception as e:
+        log.warning(
+            "first_turn_seed_failed",
+            error_type=type(e).__name__,
+            error_message=str(e),
+        )
+        remaining_time = timeout_seconds - (time.monotonic() - start_time)
+        return await run_thread_with_retry(None, user_msg, remaining_time)
+
+    log.info("first_turn_cache_hit", intent=user_msg, thread_id=thread_id[:10])
+    return reply, thread_id, list(tool_calls)
+
+
+def remember_reply(thread_id: Optional[str], user_msg: str, reply: str) -> None:
+    """Keep a turn's reply for RECENT_REPLY_TTL seconds so re-deliveries replay it.
+
+    Fallback replies are not kept, so a retry after a failure gets a real run.
+
+    Args:
+        thread_id: Thread the turn ran on; nothing is kept if empty.
+        user_msg: User message as passed to the assistant.
+        reply: Assistant reply for the turn.
+    """
+    if thread_id and reply not in _FALLBACK_REPLIES:
+        _RECENT_REPLIES[(thread_id, user_msg)] = (
+            time.monotonic() + RECENT_REPLY_TTL,
+            reply,
+            thread_id,
+        )
+
+
+async def run_thread_deduplicated(thread_id: str, user_msg: str) -> Tuple[str, str, List[ToolCall]]:
+    """Run a turn on an existing thread, replaying a reply it just produced.
+
+    Twilio re-delivers a webhook when the first delivery is slow to answer.
+    The caller holds the sender's phone_lock, so the re-delivery waits for the
+    original turn and then arrives here within RECENT_REPLY_TTL seconds of its
+    reply. That includes a session's first message, which agent_hook records
+    under the thread it created. This is only a short replay cache: a user
+    genuinely sending the same text twice within that window also gets the
+    earlier reply.
+
+    Args:
+        thread_id: Existing conversation thread ID.
+        user_msg: User message to process.
+
+    Returns:
+        Tuple of (reply, thread_id, tool_calls). A replay has no tool calls on
+        purpose, since the original turn already executed them.
+    """
+    key = (thread_id, user_msg)
+    now = time.monotonic()
+    recent = _RECENT_REPLIES.get(key)
+    if recent is not None and recent[0] > now:
+        log.info("duplicate_message_replayed", thread_id=thread_id[:10])
+        return recent[1], recent[2], []
+
+    stale = [k for k, (expires, _, _) in _RECENT_REPLIES.items() if expires <= now]
+    for stale_key in stale:
+        del _RECENT_REPLIES[stale_key]
+
+    reply, new_thread_id, tool_calls = await run_thread_with_retry(thread_id, user_msg)
+    remember_reply(thread_id, user_msg, reply)
+    return reply, new_thread_id, tool_calls
+
+
 # Tool dispatch table for cleaner handling
 def save_slot_fn(name: str, value: str) -> dict:
     """Save slot value with logging (placeholder implementation).
@@ -262,21 +596,176 @@ def finish_fn() -> dict:
     return {"status": "finished"}
 
 
-TOOL_DISPATCH = {
-    "save_slot": save_slot_fn,
-    "get_slot": get_slot_fn,
-    "validate_local": validate_local,
-    "finish": finish_fn,
-    **{fn: getattr(tools, fn) for fn in ATOMIC_FUNCS},
-}
+TOOL_DISPATCH = MappingProxyType(
+    {
+        "save_slot": save_slot_fn,
+        "get_slot": get_slot_fn,
+        "validate_local": validate_local,
+        "finish": finish_fn,
+        **{fn: getattr(tools, fn) for fn in ATOMIC_FUNCS},
+    }
+)
+
+# Tool calls are independent only if they go to different tools, since each
+# tool writes its own slot; execute_tool_calls keeps each tool's calls in
+# order. These tools also depend on every other call in the turn having
+# completed, so they run last.
+SEQUENTIAL_TOOLS = frozenset({"finish"})
+
+# Function and parameter names per tool, resolved once so dispatch is a
+# single lookup and binds arguments positionally instead of inspecting or
+# unpacking kwargs on every call
+TOOL_BINDINGS = MappingProxyType(
+    {name: (fn, tuple(inspect.signature(fn).parameters)) for name, fn in TOOL_DISPATCH.items()}
+)
 
 
+def call_tool(fn: Callable[..., Any], params: Tuple[str, ...], arguments: dict):
+    """Invoke a tool function with its pre-bound parameter order.
+
+    Args:
+        fn: Tool function from TOOL_BINDINGS.
+        params: Parameter names of fn, in positional order.
+        arguments: Tool arguments as decoded from the assistant's tool call.
+
+    Returns:
+        Any: Result returned by the tool function.
+
+    Raises:
+        KeyError: If a required argument is missing from arguments.
+    """
+    if not params:
+        return fn()
+    return fn(*[arguments[param] for param in params])
+
+
+async def execute_tool_call(call: ToolCall, thread_prefix: Optional[str], total_tools: int) -> None:
+    """Execute one assistant tool call off the event loop and log the outcome.
+
+    Failures are logged rather than raised so one bad tool call cannot abort
+    the others running alongside it.
+
+    Args:
+        call: Tool call returned by run_thread().
+        thread_prefix: Log-safe prefix of the conversation thread ID.
+        total_tools: Number of tool calls made in this turn.
+    """
+    tool_name = call.name
+    arguments = call.arguments or {}
+
+    binding = TOOL_BINDINGS.get(tool_name)
+    if binding is None:
+        log.warning(
+            "unknown_tool_called",
+            tool_name=tool_name,
+            available_tools=list(TOOL_DISPATCH.keys())[:5],  # First 5 for log size
+        )
+        return
+
+    try:
+        # Tools are blocking (DB writes), so keep them off the event loop
+        await asyncio.to_thread(call_tool, *binding, arguments)
+
+        # Enhanced tool execution logging for MVP press release flow tracking
+        log.info(
+            "tool_executed_success",
+            tool_name=tool_name,
+            thread_id_prefix=thread_prefix,
+            is_atomic_tool=tool_name in ATOMIC_FUNC_SET,
+            tool_arguments_count=len(arguments),
+        )
+
+        # Track press release completion progress
+        if tool_name in ATOMIC_FUNC_SET:
+            log.info(
+                "pr_data_saved",
+                data_type=tool_name,
+                thread_id_prefix=thread_prefix,
+            )
+        elif tool_name == "finish":
+            log.info(
+                "pr_completion",
+                thread_id_prefix=thread_prefix,
+                total_tools_used=total_tools,
+            )
+
+    except Exception as tool_error:
+        try:
+            log.error(
+                "tool_execution_failed",
+                tool_name=tool_name,
+                error_message=str(tool_error),
+                error_type=type(tool_error).__name__,
+            )
+        except Exception as log_err:
+            print(f"Tool error logging failed: {log_err}, Tool error: {tool_error}")
+
+
+async def _execute_in_order(
+    calls: List[ToolCall], thread_prefix: Optional[str], total_tools: int
+) -> None:
+    """Execute tool calls one after another, in the order given."""
+    for call in calls:
+        await execute_tool_call(call, thread_prefix, total_tools)
+
+
+async def execute_tool_calls(tool_calls: List[ToolCall], thread_prefix: Optional[str]) -> None:
+    """Execute a turn's tool calls, running independent ones concurrently.
+
+    Calls to the same tool write the same slot (the assistant may save a
+    draft and then a corrected value), so each tool's calls run in the
+    assistant's order and the last one wins. Calls to different tools run
+    concurrently. SEQUENTIAL_TOOLS run last, once every save has finished.
+
+    Args:
+        tool_calls: Tool calls returned by run_thread(), in assistant order.
+        thread_prefix: Log-safe prefix of the conversation thread ID.
+    """
+    total_tools = len(tool_calls)
+    by_tool: Dict[str, List[ToolCall]] = {}
+    for call in tool_calls:
+        if call.name not in SEQUENTIAL_TOOLS:
+            by_tool.setdefault(call.name, []).append(call)
+
+    await asyncio.gather(
+        *(_execute_in_order(calls, thread_prefix, total_tools) for calls in by_tool.values())
+    )
+    await _execute_in_order(
+        [call for call in tool_calls if call.name in SEQUENTIAL_TOOLS], thread_prefix, total_tools
+    )
+
+
+@router.on_event("shutdown")
+def _shutdown_ai_executor():
+    """Release the OpenAI worker threads when the application stops.
+
+    Pending runs are abandoned rather than awaited; their webhooks have
+    already been answered or will time out on Twilio's side.
+    """
+    _AI_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
+
+@router.on_event("shutdown")
+def _close_openai_connections():
+    """Close the pooled OpenAI keep-alive connections when the application stops."""
+    agent_runtime.close_http_client()
+
+
+@router.on_event("shutdown")
+async def _close_session_store():
+    """Close the shared session store's Redis connections when the application stops."""
+    if _session_store is not None:
+        await _session_store.close()
+
+
+@router.post("/whatsapp")
 @router.post("/agent")
 async def agent_hook(request: Request):
     """Main agent endpoint for processing WhatsApp messages.
 
     Handles incoming WhatsApp messages through AI agent conversation flow.
     Manages session state, processes reset commands, and executes tool calls.
+    Registered directly as both the /agent and the primary /whatsapp webhook.
 
     Args:
         request: FastAPI request containing WhatsApp webhook data.
@@ -286,18 +775,19 @@ async def agent_hook(request: Request):
     """
     # Generate unique request ID for complete flow tracking
     request_id = str(uuid.uuid4())[:8]
-    request_start_time = time.time()
+    request_start_time = time.monotonic()
 
-    form = await request.form()
-    phone = str(form.get("From", ""))
-    body = str(form.get("Body", ""))
+    phone, body = await read_message_fields(request)
     clean = clean_message(body)
+    phone_hash = hash_phone(phone)
+
+    # Every log line in this request (including tool tasks) carries these
+    clear_contextvars()
+    bind_contextvars(request_id=request_id, phone_hash=phone_hash)
 
     # Initial request logging with correlation ID
     log.info(
         "performance_request_start",
-        request_id=request_id,
-        phone_hash=phone[-4:] if phone else "unknown",
         message_length=len(body) if body else 0,
         clean_length=len(clean) if clean else 0,
         message_preview=clean[:50] if clean else "none",
@@ -305,250 +795,155 @@ async def agent_hook(request: Request):
     if clean is None:
         log.info(
             "performance_request_rejected",
-            request_id=request_id,
             reason="no_clean_text",
-            processing_time_ms=round((time.time() - request_start_time) * 1000, 2),
+            processing_time_ms=round((time.monotonic() - request_start_time) * 1000, 2),
         )
-        return twiml("Please send text.")
-
-    # Handle reset commands
-    if clean.lower() in ["reset", "restart", "start over", "menu", "start"]:
-        reset_start = time.time()
-        # Enhanced reset logging for MVP user tracking
-        if USE_SESSION_MANAGER:
-            existing_session = session_manager.get_session(phone)
-            session_manager.remove_session(phone)
+        return twiml_response(_SEND_TEXT_TWIML)
+
+    # Reset commands, like menu choices, are answered at once and never merged
+    # into a burst; anything else is folded with quick follow-up messages into
+    # one assistant turn, and only the first message of a burst gets the reply
+    command = clean.lower() if len(clean) <= _MAX_RESET_COMMAND_LEN else None
+    is_reset = command in RESET_COMMANDS
+    combined = await coalesce(phone, clean, standalone=is_reset or clean.strip() in MENU_SELECTIONS)
+    if combined is None:
+        log.info("message_coalesced")
+        return empty_twiml()
+    clean = combined
+
+    # One turn at a time per sender: a second message waits for the first to
+    # finish, so they cannot both create a thread or start runs on one thread,
+    # and a reset cannot be undone by a turn that was still running
+    async with phone_lock(phone):
+        if is_reset:
+            reset_start = time.monotonic()
+            # Enhanced reset logging for MVP user tracking; removal reports whether
+            # a session existed, so the session is not read first
+            had_existing_session = await session_manager.remove_session_async(phone)
             log.info(
                 "session_reset_requested",
-                request_id=request_id,
-                phone_hash=phone[-4:] if phone else "none",
-                had_existing_session=existing_session is not None,
-                existing_thread_prefix=existing_session[:10] if existing_session else None,
-                reset_command=clean.lower(),
+                had_existing_session=had_existing_session,
+                reset_command=command,
                 total_active_sessions=session_manager.get_session_count(),
             )
-        else:
-            existing_thread = _sessions.get(phone)
-            _sessions[phone] = None
+
+            reset_time = time.monotonic() - reset_start
             log.info(
-                "session_reset_requested_legacy",
-                request_id=request_id,
-                phone_hash=phone[-4:] if phone else "none",
-                had_existing_session=existing_thread is not None,
-                reset_command=clean.lower(),
+                "performance_request_complete",
+                type="reset_command",
+                processing_time_ms=round((time.monotonic() - request_start_time) * 1000, 2),
+                reset_time_ms=round(reset_time * 1000, 2),
             )
 
-        reset_time = time.time() - reset_start
-        log.info(
-            "performance_request_complete",
-            request_id=request_id,
-            type="reset_command",
-            processing_time_ms=round((time.time() - request_start_time) * 1000, 2),
-            reset_time_ms=round(reset_time * 1000, 2),
-        )
+            return twiml_response(_RESET_TWIML)
 
-        return twiml(
-            "🚀 Welcome to WhatsPR! I'm your professional press release assistant.\n\nI'll help you create a compelling press release through a quick conversation. What would you like to announce?\n\n📊 Press 1: Funding round\n📦 Press 2: Product launch\n🤝 Press 3: Partnership"
-        )
+        # Get thread_id (may be None for new sessions)
+        session_start = time.monotonic()
+        thread_id = await session_manager.get_session_async(phone)
+        thread_prefix = thread_id[:10] if thread_id else None
+        log.info("thread_retrieved", thread_id=thread_prefix, source="session_manager")
+        session_time = time.monotonic() - session_start
 
-    # Get thread_id (may be None for new sessions)
-    session_start = time.time()
-    if USE_SESSION_MANAGER:
-        thread_id = session_manager.get_session(phone)
-        log.info(
-            "thread_retrieved",
-            request_id=request_id,
-            phone_hash=phone[-4:] if phone else "none",
-            thread_id=thread_id[:10] if thread_id else None,
-            source="session_manager",
-        )
-    else:
-        thread_id = _sessions.get(phone)
-        log.info(
-            "thread_retrieved",
-            request_id=request_id,
-            phone_hash=phone[-4:] if phone else "none",
-            thread_id=thread_id[:10] if thread_id else None,
-            source="legacy_sessions",
-        )
-    session_time = time.time() - session_start
-
-    # Pre-process numeric menu selections
-    original_clean = clean
-    if clean.strip() in ["1", "1️⃣"]:
-        clean = "I want to announce a funding round"
-        log.info("menu_selection_processed", original=original_clean, converted=clean)
-    elif clean.strip() in ["2", "2️⃣"]:
-        clean = "I want to announce a product launch"
-        log.info("menu_selection_processed", original=original_clean, converted=clean)
-    elif clean.strip() in ["3", "3️⃣"]:
-        clean = "I want to announce a partnership or integration"
-        log.info("menu_selection_processed", original=original_clean, converted=clean)
+        # Pre-process numeric menu selections
+        menu_intent = MENU_SELECTIONS.get(clean.strip())
+        if menu_intent is not None:
+            log.info("menu_selection_processed", original=clean, converted=menu_intent)
+            clean = menu_intent
 
-    try:
-        request_start_time = time.time()
-
-        # Enhanced conversation flow logging for MVP user tracking
-        conversation_context = {
-            "request_id": request_id,
-            "phone_hash": phone[-4:] if phone else "none",
-            "message_length": len(clean),
-            "has_existing_session": thread_id is not None,
-            "existing_thread_prefix": thread_id[:10] if thread_id else None,
-            "is_menu_selection": clean.strip() in ["1", "1️⃣", "2", "2️⃣", "3", "3️⃣"],
-            "message_preview": clean[:50] + "..." if len(clean) > 50 else clean,
-            "session_retrieval_ms": round(session_time * 1000, 2),
-        }
-
-        if USE_SESSION_MANAGER:
-            conversation_context["total_active_sessions"] = session_manager.get_session_count()
-
-        log.info("conversation_message_received", **conversation_context)
-
-        # Use retry-enabled AI processing with timeout protection
-        ai_processing_start = time.time()
-        reply, thread_id, tool_calls = await run_thread_with_retry(thread_id, clean)
-        ai_processing_time = time.time() - ai_processing_start
-
-        # Only update session if we have a valid thread_id
-        session_update_start = time.time()
-        if thread_id and thread_id.strip():
-            if USE_SESSION_MANAGER:
-                session_manager.set_session(phone, thread_id)
+        try:
+            request_start_time = time.monotonic()
+
+            # Enhanced conversation flow logging for MVP user tracking; the context
+            # is only assembled when INFO events will actually be emitted
+            if log.is_enabled_for(logging.INFO):
+                conversation_context = {
+                    "message_length": len(clean),
+                    "has_existing_session": thread_id is not None,
+                    "existing_thread_prefix": thread_prefix,
+                    "is_menu_selection": menu_intent is not None,
+                    "message_preview": _preview(clean, 50),
+                    "session_retrieval_ms": round(session_time * 1000, 2),
+                    "total_active_sessions": session_manager.get_session_count(),
+                }
+                log.info("conversation_message_received", **conversation_context)
+
+            # Use retry-enabled AI processing with timeout protection
+            ai_processing_start = time.monotonic()
+            if thread_id is None:
+                if menu_intent is not None:
+                    reply, thread_id, tool_calls = await run_first_turn(clean)
+                else:
+                    reply, thread_id, tool_calls = await run_thread_with_retry(None, clean)
+                # A re-delivery of this message will find the new session
+                remember_reply(thread_id, clean, reply)
             else:
-                _sessions[phone] = thread_id
-        else:
-            log.error(
-                "invalid_thread_id_returned",
-                request_id=request_id,
-                thread_id=repr(thread_id),
-                phone_hash=phone[-4:] if phone else "none",
-            )
-        session_update_time = time.time() - session_update_start
-
-        processing_time = time.time() - request_start_time
-
-        # Enhanced response logging with conversation flow insights and performance metrics
-        response_context = {
-            "request_id": request_id,
-            "reply_length": len(reply),
-            "tool_count": len(tool_calls),
-            "total_processing_time_ms": round(processing_time * 1000, 2),
-            "ai_processing_time_ms": round(ai_processing_time * 1000, 2),
-            "session_update_time_ms": round(session_update_time * 1000, 2),
-            "phone_hash": phone[-4:] if phone else "none",
-            "thread_id_prefix": thread_id[:10] if thread_id else None,
-            "reply_preview": reply[:100] + "..." if len(reply) > 100 else reply,
-            "timeout_threshold_ms": get_max_ai_processing_time() * 1000,
-            "timeout_hit": ai_processing_time >= get_max_ai_processing_time(),
-        }
-
-        if USE_SESSION_MANAGER:
-            response_context["total_active_sessions_after"] = session_manager.get_session_count()
-
-        # Add tool call details for press release flow tracking
-        if tool_calls:
-            tool_names = [call.get("name", "unknown") for call in tool_calls]
-            response_context["tools_called"] = tool_names
-
-            # Track press release progress
-            atomic_tools_used = [name for name in tool_names if name in ATOMIC_FUNCS]
-            if atomic_tools_used:
-                response_context["pr_tools_used"] = atomic_tools_used
-
-        log.info("performance_request_complete", **response_context)
-
-        # Handle tool calls using dispatch table with enhanced logging
-        for call in tool_calls:
-            call_dict = dict(call)  # Ensure proper dict type for type checker
-            tool_name = call_dict.get("name", "unknown")
-
-            if tool_name in TOOL_DISPATCH:
-                try:
-                    tool_result = TOOL_DISPATCH[tool_name](**call_dict.get("arguments", {}))
-
-                    # Enhanced tool execution logging for MVP press release flow tracking
-                    log.info(
-                        "tool_executed_success",
-                        request_id=request_id,
-                        tool_name=tool_name,
-                        phone_hash=phone[-4:] if phone else "none",
-                        thread_id_prefix=thread_id[:10] if thread_id else None,
-                        is_atomic_tool=tool_name in ATOMIC_FUNCS,
-                        tool_arguments_count=len(call_dict.get("arguments", {})),
-                    )
-
-                    # Track press release completion progress
-                    if tool_name in ATOMIC_FUNCS:
-                        log.info(
-                            "pr_data_saved",
-                            data_type=tool_name,
-                            phone_hash=phone[-4:] if phone else "none",
-                            thread_id_prefix=thread_id[:10] if thread_id else None,
-                        )
-                    elif tool_name == "finish":
-                        log.info(
-                            "pr_completion",
-                            phone_hash=phone[-4:] if phone else "none",
-                            thread_id_prefix=thread_id[:10] if thread_id else None,
-                            total_tools_used=len(tool_calls),
-                        )
-
-                except Exception as tool_error:
-                    try:
-                        log.error(
-                            "tool_execution_failed",
-                            tool_name=tool_name,
-                            phone_hash=phone[-4:] if phone else "none",
-                            error_message=str(tool_error),
-                            error_type=type(tool_error).__name__,
-                        )
-                    except Exception as log_err:
-                        print(f"Tool error logging failed: {log_err}, Tool error: {tool_error}")
+                reply, thread_id, tool_calls = await run_thread_deduplicated(thread_id, clean)
+            ai_processing_time = time.monotonic() - ai_processing_start
+
+            # Only update session if we have a valid thread_id
+            session_update_start = time.monotonic()
+            if thread_id and thread_id.strip():
+                await session_manager.set_session_async(phone, thread_id)
             else:
-                log.warning(
-                    "unknown_tool_called",
-                    tool_name=tool_name,
-                    phone_hash=phone[-4:] if phone else "none",
-                    available_tools=list(TOOL_DISPATCH.keys())[:5],  # First 5 for log size
+                log.error(
+                    "invalid_thread_id_returned",
+                    thread_id=repr(thread_id),
                 )
+            session_update_time = time.monotonic() - session_update_start
+            thread_prefix = thread_id[:10] if thread_id else None
+
+            processing_time = time.monotonic() - request_start_time
+
+            # Enhanced response logging with conversation flow insights and performance metrics
+            if log.is_enabled_for(logging.INFO):
+                max_ai_processing_time = get_max_ai_processing_time()
+                response_context = {
+                    "reply_length": len(reply),
+                    "tool_count": len(tool_calls),
+                    "total_processing_time_ms": round(processing_time * 1000, 2),
+                    "ai_processing_time_ms": round(ai_processing_time * 1000, 2),
+                    "session_update_time_ms": round(session_update_time * 1000, 2),
+                    "thread_id_prefix": thread_prefix,
+                    "reply_preview": _preview(reply, 100),
+                    "timeout_threshold_ms": max_ai_processing_time * 1000,
+                    "timeout_hit": ai_processing_time >= max_ai_processing_time,
+                    "total_active_sessions_after": session_manager.get_session_count(),
+                }
+
+                # Add tool call details for press release flow tracking
+                if tool_calls:
+                    tool_names = [call.name for call in tool_calls]
+                    response_context["tools_called"] = tool_names
+
+                    # Track press release progress
+                    atomic_tools_used = [name for name in tool_names if name in ATOMIC_FUNC_SET]
+                    if atomic_tools_used:
+                        response_context["pr_tools_used"] = atomic_tools_used
+
+                log.info("performance_request_complete", **response_context)
+
+            await execute_tool_calls(tool_calls, thread_prefix)
 
-    except Exception as e:
-        # Enhanced error logging for MVP debugging
-        try:
-            log.error(
-                "conversation_processing_failed",
-                error_message=str(e),
-                error_type=type(e).__name__,
-                message_preview=clean[:50] if clean else "none",
-                had_session=thread_id is not None,
-                processing_time=(
-                    round(time.time() - request_start_time, 3)
-                    if 'request_start_time' in locals()
-                    else None
-                ),
-            )
-        except Exception as log_error:
-            # Fallback if logging fails
-            print(f"Logging error: {log_error}, Original error: {e}")
-        return twiml("Oops, temporary error. Try again.")
-    return twiml(reply)
-
-
-@router.post("/whatsapp")
-async def whatsapp_hook(request: Request):
-    """Primary WhatsApp webhook endpoint for agent mode.
-
-    Routes WhatsApp webhook requests to the agent conversation handler
-    when agent mode is enabled as the default processing mode.
-
-    Args:
-        request: FastAPI request containing WhatsApp webhook data.
-
-    Returns:
-        Response: TwiML response from agent_hook.
-    """
-    return await agent_hook(request)
+        except Exception as e:
+            # Enhanced error logging for MVP debugging
+            try:
+                log.error(
+                    "conversation_processing_failed",
+                    error_message=str(e),
+                    error_type=type(e).__name__,
+                    message_preview=clean[:50] if clean else "none",
+                    had_session=thread_id is not None,
+                    processing_time=(
+                        round(time.monotonic() - request_start_time, 3)
+                        if 'request_start_time' in locals()
+                        else None
+                    ),
+                )
+            except Exception as log_error:
+                # Fallback if logging fails
+                print(f"Logging error: {log_error}, Original error: {e}")
+            return twiml_response(_ERROR_TWIML)
+        return twiml(reply)
 
 
 @router.get("/health/sessions")
@@ -561,39 +956,26 @@ async def sessions_health():
     Returns:
         dict: Session health metrics and status information.
     """
-    if USE_SESSION_MANAGER:
-        metrics = session_manager.get_metrics()
+    metrics = cached_session_metrics()
 
-        # Add health indicators
-        health_status = "healthy"
-        warnings = []
+    # Add health indicators
+    health_status = "healthy"
+    warnings = []
 
-        # Check for potential issues
-        if metrics['active_sessions'] > 50:  # High for MVP
-            warnings.append("High session count for MVP deployment")
-            health_status = "warning"
+    # Check for potential issues
+    if metrics['active_sessions'] > 50:  # High for MVP
+        warnings.append("High session count for MVP deployment")
+        health_status = "warning"
 
-        if metrics['estimated_memory_bytes'] > 100000:  # 100KB threshold
-            warnings.append("High memory usage for session storage")
-            health_status = "warning"
+    if metrics['estimated_memory_bytes'] > 100000:  # 100KB threshold
+        warnings.append("High memory usage for session storage")
+        health_status = "warning"
 
-        return {
-            "status": health_status,
-            "session_manager": {"enabled": True, "metrics": metrics, "warnings": warnings},
-            "timestamp": time.time(),
-        }
-    else:
-        # Legacy mode metrics
-        active_legacy_sessions = len([v for v in _sessions.values() if v is not None])
-        return {
-            "status": "legacy",
-            "session_manager": {
-                "enabled": False,
-                "legacy_active_sessions": active_legacy_sessions,
-                "legacy_total_entries": len(_sessions),
-            },
-            "timestamp": time.time(),
-        }
+    return {
+        "status": health_status,
+        "session_manager": {"enabled": True, "metrics": metrics, "warnings": warnings},
+        "timestamp": time.time(),
+    }
 
 
 @router.get("/health/sessions/details")
@@ -606,17 +988,22 @@ async def sessions_details():
     Returns:
         dict: Detailed session information for debugging.
     """
-    if not USE_SESSION_MANAGER:
-        return {"error": "Session manager not enabled", "status": "legacy"}
-
     # Get metrics and add computed values
-    metrics = session_manager.get_metrics()
+    metrics = cached_session_metrics()
 
     # Calculate session age distribution (approximate)
     current_time = time.time()
+    near_expiry_minutes = (session_manager.config.ttl_seconds / 60) * 0.8  # 80% of TTL
+
+    # Only the 20 most recently accessed sessions are shown (MVP limit), so
+    # select them first and build detail dicts for those alone. The tuple()
+    # snapshot is taken in one step, so a session added or evicted by another
+    # thread cannot break the iteration.
+    sessions_snapshot = tuple(session_manager._sessions.items())
+    most_recent = heapq.nlargest(20, sessions_snapshot, key=lambda item: item[1].last_accessed)
     session_details = []
 
-    for phone, entry in session_manager._sessions.items():
+    for phone, entry in most_recent:
         # Protect privacy with phone hash
         phone_hash = phone[-4:] if len(phone) >= 4 else "****"
 
@@ -626,27 +1013,21 @@ async def sessions_details():
         session_details.append(
             {
                 "phone_hash": phone_hash,
-                "thread_id_prefix": (
-                    entry.thread_id[:10] + "..." if len(entry.thread_id) > 10 else entry.thread_id
-                ),
+                "thread_id_prefix": _preview(entry.thread_id, 10),
                 "created_minutes_ago": round(created_ago, 1),
                 "last_accessed_minutes_ago": round(accessed_ago, 1),
-                "is_near_expiry": accessed_ago
-                > (session_manager.config.ttl_seconds / 60) * 0.8,  # 80% of TTL
+                "is_near_expiry": accessed_ago > near_expiry_minutes,
             }
         )
 
-    # Sort by most recently accessed
-    session_details.sort(key=lambda x: x["last_accessed_minutes_ago"])
-
     return {
         "overview": metrics,
         "config": {
             "ttl_minutes": session_manager.config.ttl_seconds / 60,
             "cleanup_interval_seconds": session_manager.config.cleanup_interval,
         },
-        "sessions": session_details[:20],  # Limit to 20 most recent for MVP
-        "total_sessions_shown": min(len(session_details), 20),
+        "sessions": session_details,
+        "total_sessions_shown": len(session_details),
         "timestamp": current_time,
     }
 
@@ -661,8 +1042,6 @@ async def performance_metrics():
     Returns:
         dict: Performance metrics and bottleneck analysis.
     """
-    import os
-
     # Get timeout configuration for analysis
     timeout_config = {
         "ai_processing_timeout_ms": get_max_ai_processing_time() * 1000,
@@ -670,22 +1049,15 @@ async def performance_metrics():
         "max_retries": get_max_retries(),
         "retry_base_delay_ms": get_retry_base_delay() * 1000,
         "retry_max_delay_ms": get_retry_max_delay() * 1000,
+        "ai_worker_threads": AI_WORKERS,
     }
 
     # Session performance metrics
-    session_metrics = {}
-    if USE_SESSION_MANAGER:
-        session_metrics = {
-            "active_sessions": session_manager.get_session_count(),
-            "memory_usage_bytes": session_manager.estimate_memory_usage(),
-            "session_manager_enabled": True,
-        }
-    else:
-        session_metrics = {
-            "active_sessions": len([v for v in _sessions.values() if v is not None]),
-            "legacy_sessions": len(_sessions),
-            "session_manager_enabled": False,
-        }
+    session_metrics = {
+        "active_sessions": session_manager.get_session_count(),
+        "memory_usage_bytes": session_manager.estimate_memory_usage(),
+        "session_manager_enabled": True,
+    }
 
     # Environment performance factors
     env_factors = {
@@ -723,19 +1095,19 @@ async def force_session_cleanup():
     Returns:
         dict: Cleanup results and updated metrics.
     """
-    if not USE_SESSION_MANAGER:
-        return {"error": "Session manager not enabled", "status": "legacy"}
+    global _metrics_cache
 
-    # Capture before state
+    # Capture before state; bypasses the metrics cache so the delta is exact
     before_metrics = session_manager.get_metrics()
 
     # Run cleanup
-    cleanup_start = time.time()
+    cleanup_start = time.monotonic()
     removed_count = session_manager.cleanup_expired_sessions()
-    cleanup_duration = time.time() - cleanup_start
+    cleanup_duration = time.monotonic() - cleanup_start
 
-    # Capture after state
+    # Capture after state and let the other health endpoints reuse it
     after_metrics = session_manager.get_metrics()
+    _metrics_cache = (time.monotonic(), after_metrics)
 
     return {
         "cleanup_results": {
@@ -6,22 +6,76 @@ tool calls & assistant messages separately for conversation management.
 
 from __future__ import annotations
 
+import functools
 import os
 import time
 import json
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional
 
+import httpx
+import orjson
 from openai import OpenAI
 from openai.types.beta import Thread, Assistant
 from .timeout_config import timeout_manager
 
 log = logging.getLogger("whatspr.agent")
 
+
+@dataclass(slots=True, frozen=True)
+class ToolCall:
+    """A function call the assistant made during a run.
+
+    Attributes:
+        name: Function name as registered on the assistant.
+        arguments: Decoded JSON arguments.
+        id: OpenAI tool call ID.
+    """
+
+    name: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+    id: str = ""
+
+
 # ---------- one-time init ----------
 # Lazy initialization to ensure env vars are loaded
 _client = None
+_http_client = None
+
+# Assistants calls are short request/response hops; runs are polled separately
+OPENAI_HTTP_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+
+
+def get_http_client() -> httpx.Client:
+    """Get the process-wide HTTP connection pool used by OpenAI clients.
+
+    Sharing one pool lets every OpenAI client reuse warm TCP/TLS connections
+    instead of each opening its own.
+
+    Returns:
+        httpx.Client: Shared keep-alive client.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            timeout=OPENAI_HTTP_TIMEOUT,
+        )
+    return _http_client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP connection pool and drop the clients using it.
+
+    The next get_client() or get_http_client() call opens a fresh pool.
+    """
+    global _client, _http_client
+    if _http_client is not None:
+        _http_client.close()
+    _http_client = None
+    _client = None
 
 
 def get_client():
@@ -35,11 +89,33 @@ def get_client():
 
             load_dotenv()
             api_key = os.environ.get("OPENAI_API_KEY", "")
-        _client = OpenAI(api_key=api_key)
+        _client = OpenAI(
+            api_key=api_key, http_client=get_http_client(), timeout=OPENAI_HTTP_TIMEOUT
+        )
     return _client
 
 
-PROMPT = Path("prompts/assistant_v2.txt").read_text().strip()
+PROMPT_PATH = Path("prompts/assistant_v2.txt")
+
+
+def get_prompt() -> str:
+    """Read the assistant instructions on first use.
+
+    Only needed when a new assistant has to be created, so importing this
+    module neither touches the filesystem nor depends on the working directory.
+    The contents are cached until the file's modification time changes.
+
+    Returns:
+        str: Assistant instructions from PROMPT_PATH.
+    """
+    return _read_prompt(PROMPT_PATH.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_prompt(mtime_ns: int) -> str:
+    """Read PROMPT_PATH; cached per modification time (mtime_ns is the key)."""
+    return PROMPT_PATH.read_text().strip()
+
 
 # The assistant is created once; its ID is cached in a file so you don't
 # recreate it every deploy (which would blow up #assistants quickly).
@@ -55,6 +131,81 @@ ATOMIC_FUNCS = [
     "save_boilerplate",
     "save_media_contact",
 ]
+ATOMIC_FUNC_SET = frozenset(ATOMIC_FUNCS)
+
+# Function tools registered on the assistant, built once at import
+ASSISTANT_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "save_slot",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "value": {"type": "string"},
+                },
+                "required": ["name", "value"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_slot",
+            "parameters": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}},
+                "required": ["name"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "finish",
+            "parameters": {"type": "object", "properties": {}},
+        },
+    },
+    {
+        "type": "function",
+        "function": {  # NEW
+            "name": "validate_local",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "value": {"type": "string"},
+                },
+                "required": ["name", "value"],
+            },
+        },
+    },
+    *[
+        {
+            "type": "function",
+            "function": {
+                "name": fn,
+                "parameters": {
+                    "type": "object",
+                    "properties": {"value": {"type": "string"}},
+                    "required": ["value"],
+                },
+            },
+        }
+        for fn in ATOMIC_FUNCS
+    ],
+]
+
+# Outputs submitted for tools whose real work happens in the webhook after the
+# run; only validate_local is evaluated inside run_thread
+_SAVED_OUTPUT = json.dumps({"status": "saved"})
+_STATIC_TOOL_OUTPUTS = {
+    "save_slot": _SAVED_OUTPUT,
+    "get_slot": json.dumps({"value": ""}),
+    "finish": json.dumps({"status": "finished"}),
+    **{fn: _SAVED_OUTPUT for fn in ATOMIC_FUNCS},
+}
 
 
 def _get_or_create_assistant() -> str:
@@ -88,70 +239,9 @@ def _get_or_create_assistant() -> str:
 
     assistant: Assistant = get_client().beta.assistants.create(
         name="WhatsPR Agent",
-        instructions=PROMPT,
+        instructions=get_prompt(),
         model="gpt-4o-mini",  # Fastest and most cost-effective model
-        tools=[
-            {
-                "type": "function",
-                "function": {
-                    "name": "save_slot",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string"},
-                            "value": {"type": "string"},
-                        },
-                        "required": ["name", "value"],
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_slot",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {"name": {"type": "string"}},
-                        "required": ["name"],
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "finish",
-                    "parameters": {"type": "object", "properties": {}},
-                },
-            },
-            {
-                "type": "function",
-                "function": {  # NEW
-                    "name": "validate_local",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string"},
-                            "value": {"type": "string"},
-                        },
-                        "required": ["name", "value"],
-                    },
-                },
-            },
-            *[
-                {
-                    "type": "function",
-                    "function": {
-                        "name": fn,
-                        "parameters": {
-                            "type": "object",
-                            "properties": {"value": {"type": "string"}},
-                            "required": ["value"],
-                        },
-                    },
-                }
-                for fn in ATOMIC_FUNCS
-            ],
-        ],
+        tools=ASSISTANT_TOOLS,
     )
     _ASSISTANT_CACHE.write_text(assistant.id)
     return assistant.id
@@ -169,6 +259,23 @@ def get_assistant_id() -> str:
     return _assistant_id
 
 
+def assistant_version() -> Tuple[Optional[str], Optional[int]]:
+    """Identify the assistant configuration that replies currently come from.
+
+    Cheap enough to call per request: it neither creates the assistant nor
+    reads the prompt.
+
+    Returns:
+        Tuple of (assistant ID, None until first resolved; PROMPT_PATH
+        modification time in ns, None if the file is missing).
+    """
+    try:
+        prompt_mtime = PROMPT_PATH.stat().st_mtime_ns
+    except OSError:
+        prompt_mtime = None
+    return _assistant_id, prompt_mtime
+
+
 # ---------- helper API ----------
 
 
@@ -185,6 +292,22 @@ def create_thread() -> str:
     return thread.id
 
 
+def create_seeded_thread(messages: List[Dict[str, str]]) -> str:
+    """Create a new OpenAI thread pre-populated with conversation messages.
+
+    Args:
+        messages: Thread messages as {"role": ..., "content": ...} dicts, oldest first.
+
+    Returns:
+        str: The unique thread ID for the created conversation thread.
+
+    Raises:
+        Exception: If thread creation fails due to API issues.
+    """
+    thread: Thread = get_client().beta.threads.create(messages=messages)
+    return thread.id
+
+
 def cancel_active_runs(thread_id: str) -> None:
     """Cancel any active runs on a thread to prevent race conditions.
 
@@ -207,22 +330,43 @@ def cancel_active_runs(thread_id: str) -> None:
         log.warning("failed_to_check_active_runs", extra={"error": str(e)})
 
 
-def run_thread(thread_id: Optional[str], user_msg: str) -> Tuple[str, str, List[Dict[str, Any]]]:
+def cancel_run(thread_id: str, run_id: str) -> None:
+    """Cancel a run that is being abandoned so it stops consuming quota.
+
+    Args:
+        thread_id: Thread the run belongs to.
+        run_id: Run to cancel.
+    """
+    try:
+        get_client().beta.threads.runs.cancel(thread_id=thread_id, run_id=run_id)
+        log.info("cancelled_abandoned_run", extra={"run_id": run_id})
+    except Exception as e:
+        log.warning("failed_to_cancel_run", extra={"run_id": run_id, "error": str(e)})
+
+
+def run_thread(
+    thread_id: Optional[str], user_msg: str, timeout_seconds: Optional[float] = None
+) -> Tuple[str, str, List[ToolCall]]:
     """Execute conversation turn with OpenAI Assistant.
 
     Sends user message to assistant, handles tool calls, and returns response.
     Creates new thread lazily if none provided. Implements exponential backoff
     polling for run completion with timeout protection.
 
+    The caller's asyncio timeout cannot stop this function once it is running
+    on a worker thread, so timeout_seconds bounds the polling itself: when it
+    runs out, the run is cancelled server-side instead of polled to the end.
+
     Args:
         thread_id: Optional conversation thread ID. Creates new if None.
         user_msg: User's message content to send to assistant.
+        timeout_seconds: Optional time budget for the whole turn, in seconds.
 
     Returns:
         Tuple containing:
             - Assistant's reply text
             - Thread ID (created if was None)
-            - List of tool call data (currently empty)
+            - Tool calls the assistant made during the run
 
     Raises:
         RuntimeError: If run fails, is cancelled, or times out after max attempts.
@@ -231,15 +375,16 @@ def run_thread(thread_id: Optional[str], user_msg: str) -> Tuple[str, str, List[
     from .validator_tool import validate_local
 
     # Start performance timing
-    total_start_time = time.time()
+    total_start_time = time.monotonic()
+    deadline = total_start_time + timeout_seconds if timeout_seconds else None
     thread_creation_time = 0
     cancel_runs_time = 0
 
     # Lazy thread creation - only create when actually needed
     if thread_id is None:
-        thread_start = time.time()
+        thread_start = time.monotonic()
         thread_id = create_thread()
-        thread_creation_time = time.time() - thread_start
+        thread_creation_time = time.monotonic() - thread_start
         log.info(
             "performance_thread_created",
             extra={
@@ -249,9 +394,9 @@ def run_thread(thread_id: Optional[str], user_msg: str) -> Tuple[str, str, List[
         )
     else:
         # Cancel any active runs to prevent race conditions
-        cancel_start = time.time()
+        cancel_start = time.monotonic()
         cancel_active_runs(thread_id)
-        cancel_runs_time = time.time() - cancel_start
+        cancel_runs_time = time.monotonic() - cancel_start
         log.debug(
             "performance_cancel_runs",
             extra={
@@ -264,13 +409,13 @@ def run_thread(thread_id: Optional[str], user_msg: str) -> Tuple[str, str, List[
         time.sleep(0.5)
 
     # 1. append user message
-    message_start = time.time()
+    message_start = time.monotonic()
     get_client().beta.threads.messages.create(
         thread_id=thread_id,
         role="user",
         content=user_msg,
     )
-    message_creation_time = time.time() - message_start
+    message_creation_time = time.monotonic() - message_start
     log.debug(
         "performance_message_created",
         extra={
@@ -281,14 +426,14 @@ def run_thread(thread_id: Optional[str], user_msg: str) -> Tuple[str, str, List[
     )
 
     # 2. kick off a run
-    run_start = time.time()
+    run_start = time.monotonic()
     run = get_client().beta.threads.runs.create(
         thread_id=thread_id,
         assistant_id=get_assistant_id(),
         # No instructions override: already baked into the assistant.
         timeout=timeout_manager.config.openai_request_timeout,  # server-side request timeout
     )
-    run_creation_time = time.time() - run_start
+    run_creation_time = time.monotonic() - run_start
     log.info(
         "performance_run_created",
         extra={
@@ -299,7 +444,7 @@ def run_thread(thread_id: Optional[str], user_msg: str) -> Tuple[str, str, List[
     )
 
     # 3. poll with exponential back-off and handle tool calls
-    polling_start = time.time()
+    polling_start = time.monotonic()
     delay = timeout_manager.config.polling_base_delay
     max_attempts = timeout_manager.config.polling_max_attempts  # Prevent infinite loops
     attempts = 0
@@ -309,9 +454,9 @@ def run_thread(thread_id: Optional[str], user_msg: str) -> Tuple[str, str, List[
 
     while attempts < max_attempts:
         attempts += 1
-        poll_attempt_start = time.time()
+        poll_attempt_start = time.monotonic()
         run = get_client().beta.threads.runs.retrieve(thread_id=thread_id, run_id=run.id)
-        poll_attempt_time = time.time() - poll_attempt_start
+        poll_attempt_time = time.monotonic() - poll_attempt_start
         total_poll_time += poll_attempt_time
 
         log.debug(
@@ -334,62 +479,39 @@ def run_thread(thread_id: Optional[str], user_msg: str) -> Tuple[str, str, List[
             tool_outputs = []
             for tool_call in run.required_action.submit_tool_outputs.tool_calls:
                 # Track this tool call for return value
-                tool_calls_made.append(
-                    {
-                        "name": tool_call.function.name,
-                        "arguments": json.loads(tool_call.function.arguments),
-                        "id": tool_call.id,
-                    }
-                )
-
-                if tool_call.function.name == "validate_local":
-                    args = json.loads(tool_call.function.arguments)
-                    result = validate_local(args["name"], args["value"])
-                    tool_outputs.append(
-                        {"tool_call_id": tool_call.id, "output": json.dumps(result)}
-                    )
-                elif tool_call.function.name == "save_slot":
-                    # Handle save_slot if needed
-                    tool_outputs.append(
-                        {
-                            "tool_call_id": tool_call.id,
-                            "output": json.dumps({"status": "saved"}),
-                        }
-                    )
-                elif tool_call.function.name == "get_slot":
-                    # Handle get_slot if needed
-                    tool_outputs.append(
-                        {
-                            "tool_call_id": tool_call.id,
-                            "output": json.dumps({"value": ""}),
-                        }
-                    )
-                elif tool_call.function.name == "finish":
-                    tool_outputs.append(
-                        {
-                            "tool_call_id": tool_call.id,
-                            "output": json.dumps({"status": "finished"}),
-                        }
-                    )
-                elif tool_call.function.name in ATOMIC_FUNCS:
-                    # Handle atomic tools - return success for now
-                    tool_outputs.append(
-                        {
-                            "tool_call_id": tool_call.id,
-                            "output": json.dumps({"status": "saved"}),
-                        }
-                    )
+                name = tool_call.function.name
+                # Parsed once and shared by the returned ToolCall and validate_local
+                args = orjson.loads(tool_call.function.arguments or "{}")
+                tool_calls_made.append(ToolCall(name=name, arguments=args, id=tool_call.id))
+
+                if name == "validate_local":
+                    output = json.dumps(validate_local(args["name"], args["value"]))
+                else:
+                    output = _STATIC_TOOL_OUTPUTS.get(name)
+                    if output is None:
+                        continue
+                tool_outputs.append({"tool_call_id": tool_call.id, "output": output})
 
             # Submit tool outputs
             if tool_outputs:
                 run = get_client().beta.threads.runs.submit_tool_outputs(
                     thread_id=thread_id, run_id=run.id, tool_outputs=tool_outputs
                 )
+                # The resumed run usually finishes quickly; poll it at the base
+                # interval instead of the back-off reached before the tool call
+                delay = timeout_manager.config.polling_base_delay
         else:
-            # Still running, wait and try again
-            sleep_start = time.time()
-            time.sleep(delay)
-            sleep_time = time.time() - sleep_start
+            # Still running, wait and try again within the remaining budget
+            sleep_start = time.monotonic()
+            sleep_for = delay
+            if deadline is not None:
+                remaining = deadline - sleep_start
+                if remaining <= 0:
+                    cancel_run(thread_id, run.id)
+                    raise RuntimeError(f"Run {run.id} exceeded {timeout_seconds}s, cancelled")
+                sleep_for = min(delay, remaining)
+            time.sleep(sleep_for)
+            sleep_time = time.monotonic() - sleep_start
             total_sleep_time += sleep_time
             delay = min(delay * 2, timeout_manager.config.polling_max_delay)
 
@@ -402,23 +524,27 @@ def run_thread(thread_id: Optional[str], user_msg: str) -> Tuple[str, str, List[
                 },
             )
 
-    if attempts >= max_attempts:
+    if run.status != "completed":
+        cancel_run(thread_id, run.id)
         raise RuntimeError(f"Run {run.id} timed out after {max_attempts} attempts")
 
-    # 4. fetch last assistant message (sorted by created_at desc)
-    message_fetch_start = time.time()
-    msgs = get_client().beta.threads.messages.list(thread_id=thread_id, limit=5)
+    # 4. fetch the reply: the newest message this run created (created_at desc)
+    message_fetch_start = time.monotonic()
+    msgs = get_client().beta.threads.messages.list(
+        thread_id=thread_id, run_id=run.id, order="desc", limit=1
+    )
     assistant_msg = next((m for m in msgs.data if m.role == "assistant"), None)
     reply_text = (
         assistant_msg.content[0].text.value
         if assistant_msg and hasattr(assistant_msg.content[0], "text")
         else "[No response]"
     )
-    message_fetch_time = time.time() - message_fetch_start
+    message_fetch_time = time.monotonic() - message_fetch_start
 
     # Calculate comprehensive timing metrics
-    total_time = time.time() - total_start_time
-    polling_total_time = time.time() - polling_start
+    end_time = time.monotonic()
+    total_time = end_time - total_start_time
+    polling_total_time = end_time - polling_start
 
     # Log comprehensive performance summary
     log.info(
@@ -443,6 +569,6 @@ def run_thread(thread_id: Optional[str], user_msg: str) -> Tuple[str, str, List[
 
     # 5. collect tool call payloads (if any) - return the actual calls made
     # Tool handling is done internally in the polling loop above
-    tools: List[Dict[str, Any]] = tool_calls_made
+    tools: List[ToolCall] = tool_calls_made
 
     return reply_text, thread_id, tools
@@ -2,30 +2,81 @@
 
 Provides buffering functionality to combine multiple messages from the same
 sender within a time window to handle rapid typing or message splitting.
+Only senders with an open window are held in memory.
 """
 
-import time
-from collections import defaultdict
+import asyncio
+import os
 
-WINDOW = 3  # seconds
-_buffer: dict[str, tuple[str, float]] = defaultdict(lambda: ("", 0.0))
+# Webhook-side coalescing of quick bursts ("hi" / "I need" / "a funding round")
+COALESCE_WINDOW = float(os.environ.get("MESSAGE_COALESCE_WINDOW_MS", "400")) / 1000
+MAX_BATCH_MESSAGES = 5
+MAX_BATCH_CHARS = 2000
 
 
-def aggregate(sender: str, msg: str) -> str | None:
-    """Aggregate messages from sender within time window.
+class _Batch:
+    """Messages collected from one sender during an open coalescing window."""
+
+    __slots__ = ("messages", "chars", "full")
+
+    def __init__(self, msg: str):
+        self.messages = [msg]
+        self.chars = len(msg)
+        self.full = asyncio.Event()
+
+
+_pending: dict[str, _Batch] = {}
+
+
+async def coalesce(sender: str, msg: str, standalone: bool = False) -> str | None:
+    """Merge a burst of messages from one sender into a single turn.
+
+    The first message from a sender opens a COALESCE_WINDOW-second window and
+    messages arriving during it join that batch. The batch closes early once
+    it holds MAX_BATCH_MESSAGES messages or MAX_BATCH_CHARS characters.
+
+    A standalone message (a menu choice, say, whose meaning would be lost
+    inside a longer text) never waits or joins a batch. It closes the
+    sender's open batch, lets that batch's caller go first, and is returned
+    on its own.
 
     Args:
         sender: Message sender identifier.
-        msg: New message content to aggregate.
+        msg: New message content.
+        standalone: Process msg as its own turn without a window.
 
     Returns:
-        Optional[str]: Combined message if window expired, None if still buffering.
+        Optional[str]: Newline-joined batch for the caller that opened the
+        window, None for callers whose message was folded into it.
     """
-    text, timestamp = _buffer[sender]
-    now = time.time()
-    if now - timestamp < WINDOW:
-        _buffer[sender] = (text + " " + msg, now)
-        return None  # still accumulating
-    else:
-        _buffer[sender] = (msg, now)
-        return text.strip() if text else msg
+    batch = _pending.get(sender)
+    if standalone:
+        if batch is not None:
+            del _pending[sender]
+            batch.full.set()
+            # Yield once so the earlier batch reaches the sender's turn lock first
+            await asyncio.sleep(0)
+        return msg
+
+    if batch is not None:
+        batch.messages.append(msg)
+        batch.chars += len(msg)
+        if len(batch.messages) >= MAX_BATCH_MESSAGES or batch.chars >= MAX_BATCH_CHARS:
+            # Close now so the next message starts a fresh batch
+            del _pending[sender]
+            batch.full.set()
+        return None
+
+    if COALESCE_WINDOW <= 0:
+        return msg
+
+    batch = _pending[sender] = _Batch(msg)
+    try:
+        async with asyncio.timeout(COALESCE_WINDOW):
+            await batch.full.wait()
+    except TimeoutError:
+        pass
+    finally:
+        if _pending.get(sender) is batch:
+            del _pending[sender]
+    return "\n".join(batch.messages)
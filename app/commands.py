@@ -5,33 +5,32 @@ like help, reset, and field changes in conversation flow.
 """
 
 from typing import Optional
-from fastapi.responses import Response
-from twilio.twiml.messaging_response import MessagingResponse
 
+from .prefilter import render_twiml, twiml, twiml_response
 
-def _tw(text: str) -> Response:
-    """Create a TwiML response with the given message text."""
-    r = MessagingResponse()
-    r.message(text)
-    return Response(str(r), media_type="application/xml")
+HELP_TEXT = "Commands:\n/reset – start over\n/change – change category\n/help – this help"
+
+# Fixed replies rendered once; only slot-specific help is rendered per call
+_HELP_TWIML = render_twiml(HELP_TEXT)
+_RESET_TWIML = render_twiml("Session reset. Send any message to start again.")
+_CHANGE_TWIML = render_twiml("Sure—let's choose a different category. Reply with 1, 2, or 3.")
 
 
 def handle_help(current_slot: Optional[str] = None):
     """Handle help command, showing available commands and slot-specific examples."""
-    extra = f"\n/example – example answer for {current_slot}" if current_slot else ""
-    return _tw(
-        "Commands:\n/reset – start over\n/change – change category\n/help – this help" + extra
-    )
+    if current_slot:
+        return twiml(HELP_TEXT + f"\n/example – example answer for {current_slot}")
+    return twiml_response(_HELP_TWIML)
 
 
 def handle_reset(current_slot: Optional[str] = None):
     """Handle reset command, clearing the current session."""
-    return _tw("Session reset. Send any message to start again.")
+    return twiml_response(_RESET_TWIML)
 
 
 def handle_change(current_slot: Optional[str] = None):
     """Handle change command, allowing user to pick a different category."""
-    return _tw("Sure—let's choose a different category. Reply with 1, 2, or 3.")
+    return twiml_response(_CHANGE_TWIML)
 
 
 # Command aliases mapping - enhanced with more aliases
@@ -46,6 +45,7 @@ COMMANDS = {
     "/cancel": handle_reset,
     "stop": handle_reset,
 }
+_MAX_COMMAND_LEN = max(map(len, COMMANDS))
 
 
 def maybe_command(body: str, current_slot: Optional[str] = None):
@@ -58,7 +58,15 @@ def maybe_command(body: str, current_slot: Optional[str] = None):
     Returns:
         TwiML Response if command was handled, None otherwise
     """
-    token = body.lower().split()[0]
-    if token in COMMANDS:
-        return COMMANDS[token](current_slot)
-    return None
+    # Only the first _MAX_COMMAND_LEN + 1 characters can decide the match, so
+    # long messages are neither lowercased nor split in full
+    head = body.lstrip()[: _MAX_COMMAND_LEN + 1]
+    if not head:
+        return None
+    token = head.split(None, 1)[0]
+    if len(token) > _MAX_COMMAND_LEN:
+        return None
+    handler = COMMANDS.get(token.lower())
+    if handler is None:
+        return None
+    return handler(current_slot)
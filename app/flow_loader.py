@@ -2,12 +2,24 @@
 
 Loads YAML flow specifications that define conversation structure,
 field requirements, and validation rules for press release data collection.
+yaml and jsonschema are imported on first load, so importing this module is cheap.
 """
 
-import yaml
-import jsonschema
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
 from pathlib import Path
 
+log = logging.getLogger("whatspr.flow")
+
+# Parsed specs are cached here as JSON, outside the source tree
+FLOW_CACHE_DIR = Path(
+    os.environ.get("FLOW_CACHE_DIR", Path(tempfile.gettempdir()) / "whatspr-flow-cache")
+)
+
 SCHEMA = {
     "type": "object",
     "required": ["flow_id", "slots", "max_turns"],
@@ -26,9 +38,90 @@ SCHEMA = {
 }
 
 
+@functools.lru_cache(maxsize=1)
+def _schema_validator():
+    """Build the validator for SCHEMA once, checking the schema itself only then."""
+    import jsonschema
+
+    validator_cls = jsonschema.validators.validator_for(SCHEMA)
+    validator_cls.check_schema(SCHEMA)
+    return validator_cls(SCHEMA)
+
+
+def _cache_path(source: Path) -> Path:
+    """Return the cache file for a flow spec, named by a digest of its absolute path.
+
+    Args:
+        source: Flow YAML file.
+
+    Returns:
+        Path: JSON cache file inside FLOW_CACHE_DIR.
+    """
+    digest = hashlib.blake2b(str(source.resolve()).encode(), digest_size=8).hexdigest()
+    return FLOW_CACHE_DIR / f"{source.stem}-{digest}.json"
+
+
+def _read_cache(cache: Path, source_hash: str):
+    """Return the spec cached for this exact YAML content, if there is one.
+
+    Args:
+        cache: JSON cache file.
+        source_hash: Digest of the current YAML bytes.
+
+    Returns:
+        Optional[dict]: Cached spec, or None if missing, unreadable or stale.
+    """
+    try:
+        cached = json.loads(cache.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("source_hash") != source_hash:
+        return None
+    return cached.get("flow")
+
+
+def _write_cache(cache: Path, source_hash: str, data) -> None:
+    """Store a validated spec, atomically, if JSON can represent it exactly.
+
+    Failing to write the cache is not an error; the next load parses the
+    YAML again.
+
+    Args:
+        cache: JSON cache file.
+        source_hash: Digest of the YAML bytes data was parsed from.
+        data: Validated flow spec.
+    """
+    try:
+        encoded = json.dumps({"source_hash": source_hash, "flow": data})
+    except (TypeError, ValueError):
+        log.debug(f"flow_cache_skipped path={cache.name} reason=not_json_serializable")
+        return
+    if json.loads(encoded)["flow"] != data:
+        # e.g. integer mapping keys would come back as strings
+        log.debug(f"flow_cache_skipped path={cache.name} reason=lossy_json")
+        return
+
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as tmp:
+                tmp.write(encoded)
+            os.replace(tmp_name, cache)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        log.debug(f"flow_cache_write_failed path={cache.name} error={type(e).__name__}")
+
+
 def load_flow(path: str):
     """Load conversation flow specification from YAML file.
 
+    A validated copy is kept as JSON in FLOW_CACHE_DIR together with a digest
+    of the YAML it came from. While the YAML bytes match that digest, the
+    copy is returned without parsing the YAML or validating it again.
+
     Args:
         path: File path to YAML flow specification.
 
@@ -38,6 +131,24 @@ def load_flow(path: str):
     Raises:
         ValidationError: If flow specification doesn't match schema.
     """
-    data = yaml.safe_load(Path(path).read_text())
-    jsonschema.validate(data, SCHEMA)
+    source = Path(path)
+    raw = source.read_bytes()
+    source_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    cache = _cache_path(source)
+    data = _read_cache(cache, source_hash)
+    if data is not None:
+        return data
+
+    import jsonschema
+    import yaml
+
+    # libyaml's C parser when PyYAML was built with it, else the pure-Python one
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(raw, Loader=loader)
+    # Same error jsonschema.validate() would raise, without re-checking SCHEMA
+    error = jsonschema.exceptions.best_match(_schema_validator().iter_errors(data))
+    if error is not None:
+        raise error
+
+    _write_cache(cache, source_hash, data)
     return data
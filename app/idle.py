@@ -4,18 +4,40 @@ Provides functions to determine if a user session should be considered
 idle based on last activity timestamps.
 """
 
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timezone
+from typing import Union
 
-IDLE_THRESHOLD = timedelta(hours=1)
+IDLE_THRESHOLD_SEC = 3600.0
 
 
-def is_idle(last_seen: datetime) -> bool:
+def epoch_seconds(moment: datetime) -> float:
+    """Convert a datetime to Unix epoch seconds.
+
+    Naive datetimes are taken as UTC, matching the datetime.utcnow() values
+    stored in the models, rather than as local time.
+
+    Args:
+        moment: Naive UTC or timezone-aware datetime.
+
+    Returns:
+        float: Seconds since the Unix epoch.
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def is_idle(last_seen: Union[float, datetime]) -> bool:
     """Check if enough time has passed since last seen.
 
     Args:
-        last_seen: Timestamp of last user activity.
+        last_seen: Epoch seconds of last user activity, or a datetime (naive
+            values are taken as UTC). Passing epoch seconds avoids a conversion.
 
     Returns:
         bool: True if session is considered idle (>1 hour), False otherwise.
     """
-    return datetime.utcnow() - last_seen > IDLE_THRESHOLD
+    if isinstance(last_seen, datetime):
+        last_seen = epoch_seconds(last_seen)
+    return time.time() - last_seen > IDLE_THRESHOLD_SEC
@@ -31,7 +31,14 @@ log = structlog.get_logger("legacy")
 
 router = APIRouter()
 
-RESET_WORDS = {"reset", "new", "start"}
+RESET_WORDS = frozenset({"reset", "new", "start"})
+
+# Whole-message replies to the category menu, matched lowercased
+CATEGORY_CHOICES = {
+    **dict.fromkeys(("1", "fund", "funding", "raise"), "Funding round"),
+    **dict.fromkeys(("2", "product", "launch", "feature"), "Product launch"),
+    **dict.fromkeys(("3", "partner", "partnership", "integration"), "Partnership / integration"),
+}
 
 
 def twiml(text: str) -> Response:
@@ -88,8 +95,10 @@ async def whatsapp(request: Request):
     if command_response:
         return command_response
 
-    # reset keyword (legacy support)
-    if body.lower().split()[0] in RESET_WORDS:
+    # reset keyword (legacy support); the message is lowercased once for all
+    # keyword checks below
+    body_lower = body.lower()
+    if body_lower.split(None, 1)[0] in RESET_WORDS:
         session = _force_new_session(phone)
         if session.id:
             record_message_sid(session.id, sid)
@@ -112,15 +121,9 @@ async def whatsapp(request: Request):
     # For completely new sessions (no answers), show the menu
     if answered_count == 0:
         # Check if this is a category selection
-        body_lower = body.lower()
-        if body_lower in ["1", "fund", "funding", "raise"]:
-            save_answer(session.id, "announcement_type", "Funding round")
-            log.info("saved", phone=phone[-4:], field="announcement_type")
-        elif body_lower in ["2", "product", "launch", "feature"]:
-            save_answer(session.id, "announcement_type", "Product launch")
-            log.info("saved", phone=phone[-4:], field="announcement_type")
-        elif body_lower in ["3", "partner", "partnership", "integration"]:
-            save_answer(session.id, "announcement_type", "Partnership / integration")
+        announcement_type = CATEGORY_CHOICES.get(body_lower)
+        if announcement_type is not None:
+            save_answer(session.id, "announcement_type", announcement_type)
             log.info("saved", phone=phone[-4:], field="announcement_type")
         else:
             # First time user or invalid selection, show menu
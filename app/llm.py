@@ -24,8 +24,9 @@ def rephrase_question(field: str) -> str:
 
     try:
         from openai import OpenAI
+        from .agent_runtime import get_http_client
 
-        client = OpenAI(api_key=settings.openai_api_key)
+        client = OpenAI(api_key=settings.openai_api_key, http_client=get_http_client())
 
         user_msg = (
             "Rewrite the following prompt into a friendly, single-sentence question "
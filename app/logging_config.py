@@ -4,7 +4,9 @@ Configures structlog for JSON logging with timestamp and privacy protection
 for sensitive information like phone numbers and email addresses.
 """
 
+import json
 import logging
+import orjson
 import structlog
 import sys
 
@@ -26,9 +28,32 @@ def scrub_pii(logger, _, event):
     return event
 
 
+def render_json(event, **kwargs) -> bytes:
+    """Serialize a log event with orjson, falling back to the json module.
+
+    orjson rejects values the json module accepts, such as integers wider
+    than 64 bits (e.g. a long number the assistant passed to a tool). Those
+    events are rendered with json.dumps instead of failing the log call.
+
+    Args:
+        event: Log event dictionary.
+        **kwargs: Options from JSONRenderer, e.g. the default= fallback handler.
+
+    Returns:
+        bytes: JSON-encoded event.
+    """
+    try:
+        return orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS, **kwargs)
+    except TypeError:
+        return json.dumps(event, **kwargs).encode()
+
+
 def configure_logging(level=logging.INFO):
     """Configure structured logging with JSON output and PII protection.
 
+    Values bound with structlog.contextvars (request_id, phone_hash) are merged
+    into every event before PII scrubbing.
+
     Args:
         level: Logging level (default: INFO).
     """
@@ -36,8 +61,13 @@ def configure_logging(level=logging.INFO):
     structlog.configure(
         wrapper_class=structlog.make_filtering_bound_logger(level),
         processors=[
+            structlog.contextvars.merge_contextvars,
             structlog.processors.TimeStamper(fmt="iso"),
             scrub_pii,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=render_json),
         ],
+        # orjson renders bytes, so write straight to the stdout buffer
+        logger_factory=structlog.BytesLoggerFactory(),
+        # Module-level loggers resolve this configuration once, on first use
+        cache_logger_on_first_use=True,
     )
@@ -5,6 +5,7 @@ sets up logging, and routes between legacy and agent modes based on
 environment configuration.
 """
 
+import asyncio
 import os
 import structlog
 from fastapi import FastAPI
@@ -54,7 +55,9 @@ def _startup():
         print("✅ Twilio auth token configured")
 
     init_db()
-    log.info("db_ready", legacy_mode=LEGACY)
+    # "uvloop" in production (see Dockerfile); "asyncio" means the fallback loop
+    event_loop = type(asyncio.get_running_loop()).__module__.split(".")[0]
+    log.info("db_ready", legacy_mode=LEGACY, event_loop=event_loop)
 
 
 if LEGACY:
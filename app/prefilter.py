@@ -7,7 +7,6 @@ for WhatsApp message processing with length validation and sanitization.
 import re
 from typing import Optional
 import structlog
-from twilio.twiml.messaging_response import MessagingResponse
 from fastapi.responses import Response
 
 log = structlog.get_logger("prefilter")
@@ -15,6 +14,38 @@ log = structlog.get_logger("prefilter")
 MAX_LEN = 1000
 EMOJI_RE = re.compile("[\U00010000-\U0010ffff]", flags=re.UNICODE)
 
+# Same document Twilio's MessagingResponse renders for a single <Message>
+_TWIML_HEAD = '<?xml version="1.0" encoding="UTF-8"?><Response><Message>'
+_TWIML_TAIL = "</Message></Response>"
+_EMPTY_TWIML = b'<?xml version="1.0" encoding="UTF-8"?><Response />'
+
+
+def render_twiml(text: str) -> bytes:
+    """Render the TwiML document for a single WhatsApp message.
+
+    Fixed replies can be rendered once at import and sent with twiml_response().
+
+    Args:
+        text: Message text to send back to WhatsApp user.
+
+    Returns:
+        bytes: UTF-8 encoded TwiML XML.
+    """
+    escaped = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return (_TWIML_HEAD + escaped + _TWIML_TAIL).encode("utf-8")
+
+
+def twiml_response(body: bytes) -> Response:
+    """Wrap an already rendered TwiML document in a response.
+
+    Args:
+        body: TwiML XML from render_twiml().
+
+    Returns:
+        Response: FastAPI response with TwiML XML content.
+    """
+    return Response(body, media_type="application/xml")
+
 
 def twiml(text: str) -> Response:
     """Create a TwiML response for WhatsApp messaging.
@@ -25,14 +56,24 @@ def twiml(text: str) -> Response:
     Returns:
         Response: FastAPI response with TwiML XML content.
     """
-    r = MessagingResponse()
-    r.message(text)
-    return Response(str(r), media_type="application/xml")
+    return twiml_response(render_twiml(text))
+
+
+def empty_twiml() -> Response:
+    """Create a TwiML response that sends no message back.
+
+    Returns:
+        Response: FastAPI response with an empty TwiML document.
+    """
+    return twiml_response(_EMPTY_TWIML)
 
 
 def clean_message(raw: str) -> Optional[str]:
     """Clean and validate incoming message text.
 
+    Runs on every inbound message. Plain ASCII text, the common case, cannot
+    contain astral-plane emoji, so it skips the regex pass entirely.
+
     Args:
         raw: The raw message text
 
@@ -41,5 +82,5 @@ def clean_message(raw: str) -> Optional[str]:
     """
     if len(raw) > MAX_LEN:
         return None
-    no_emoji = EMOJI_RE.sub("", raw)
+    no_emoji = raw if raw.isascii() else EMOJI_RE.sub("", raw)
     return no_emoji.strip() or None
@@ -15,6 +15,10 @@ class SessionConfig:
         ttl_seconds: Time-to-live for sessions in seconds.
         cleanup_interval: How often to run cleanup in seconds.
         allow_test_values: Allow short values for testing purposes.
+        max_sessions: Maximum number of sessions held before the least
+            recently used one is evicted.
+        store_refresh_seconds: How long a local session is trusted before the
+            shared store is read again to pick up other workers' changes.
 
     Raises:
         ValueError: If configuration values are invalid.
@@ -23,6 +27,8 @@ class SessionConfig:
     ttl_seconds: float = 1800  # 30 minutes default
     cleanup_interval: float = 300  # 5 minutes default
     allow_test_values: bool = False  # Allow short values for testing
+    max_sessions: int = 10000  # Bound memory against spoofed/unique senders
+    store_refresh_seconds: float = 5  # Local copy of a shared session is this fresh
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -38,6 +44,12 @@ class SessionConfig:
         if self.cleanup_interval >= self.ttl_seconds:
             raise ValueError("Cleanup interval should be less than TTL")
 
+        if self.max_sessions < 1:
+            raise ValueError("Max sessions must be at least 1")
+
+        if self.store_refresh_seconds < 0:
+            raise ValueError("Store refresh interval cannot be negative")
+
     def is_valid(self) -> bool:
         """Check if configuration is valid.
 
@@ -57,11 +69,20 @@ class SessionConfig:
         Environment variables:
             SESSION_TTL_SECONDS: Session time-to-live in seconds
             SESSION_CLEANUP_INTERVAL: Cleanup interval in seconds
+            SESSION_MAX_SESSIONS: Sessions held before LRU eviction
+            SESSION_STORE_REFRESH_SECONDS: Seconds a shared session is served locally
 
         Returns:
             SessionConfig: Configuration loaded from environment.
         """
         ttl_seconds = int(os.getenv('SESSION_TTL_SECONDS', '1800'))
         cleanup_interval = int(os.getenv('SESSION_CLEANUP_INTERVAL', '300'))
-
-        return cls(ttl_seconds=ttl_seconds, cleanup_interval=cleanup_interval)
+        max_sessions = int(os.getenv('SESSION_MAX_SESSIONS', '10000'))
+        store_refresh_seconds = float(os.getenv('SESSION_STORE_REFRESH_SECONDS', '5'))
+
+        return cls(
+            ttl_seconds=ttl_seconds,
+            cleanup_interval=cleanup_interval,
+            max_sessions=max_sessions,
+            store_refresh_seconds=store_refresh_seconds,
+        )
@@ -1,15 +1,20 @@
 """Session management with TTL-based cleanup.
 
 Provides SessionManager for managing conversation sessions with automatic cleanup
-to prevent memory leaks in the WhatsApp chatbot.
+and a size bound (LRU eviction) to prevent memory leaks in the WhatsApp chatbot.
+An optional shared store lets several workers see the same sessions; the local
+entries then act as a short-lived cache in front of it.
 """
 
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, Optional, Any
 from dataclasses import dataclass
 
 from .session_config.session_config import SessionConfig
+from .session_store import RedisSessionStore, SessionStoreError
 
 log = logging.getLogger("whatspr.session")
 
@@ -22,11 +27,14 @@ class SessionEntry:
         thread_id: OpenAI thread ID for the conversation.
         created_at: When the session was created.
         last_accessed: When the session was last accessed.
+        checked_at: time.monotonic() when the entry was last read from or
+            written to the shared store.
     """
 
     thread_id: str
     created_at: datetime
     last_accessed: datetime
+    checked_at: float = 0.0
 
 
 class SessionManager:
@@ -35,23 +43,36 @@ class SessionManager:
     Provides automatic cleanup of expired sessions to prevent memory leaks.
     Thread-safe for concurrent access from multiple requests.
 
+    The synchronous methods only touch this process's sessions. With a shared
+    store, the *_async methods are used instead: they write through to the
+    store and re-read it once a local entry is older than
+    config.store_refresh_seconds, so resets and new threads made by other
+    workers are picked up.
+
     Args:
         config: Session configuration including TTL and cleanup intervals.
+        store: Optional shared store used by the *_async methods.
     """
 
-    def __init__(self, config: Optional[SessionConfig] = None):
+    def __init__(
+        self, config: Optional[SessionConfig] = None, store: Optional[RedisSessionStore] = None
+    ):
         """Initialize SessionManager with configuration.
 
         Args:
             config: Session configuration. Uses defaults if None.
+            store: Optional shared session store. In-memory only if None.
         """
         self.config = config or SessionConfig()
-        self._sessions: Dict[str, SessionEntry] = {}
+        self._store = store
+        # Ordered by recency of access so the LRU entry is always first
+        self._sessions: "OrderedDict[str, SessionEntry]" = OrderedDict()
         self._last_cleanup = datetime.now()
 
         # Metrics tracking
         self._total_sessions_created = 0
         self._total_sessions_expired = 0
+        self._total_sessions_evicted = 0
 
         log.info(
             f"session_manager_initialized ttl_seconds={self.config.ttl_seconds} cleanup_interval={self.config.cleanup_interval}"
@@ -96,6 +117,7 @@ class SessionManager:
         # Update last accessed time and log successful access
         old_last_accessed = entry.last_accessed
         entry.last_accessed = datetime.now()
+        self._sessions.move_to_end(phone)
 
         # Log session access with useful metrics for MVP monitoring
         session_age_minutes = round(
@@ -130,8 +152,13 @@ class SessionManager:
 
         if is_new_session:
             self._total_sessions_created += 1
+            self._evict_if_full()
+        else:
+            self._sessions.move_to_end(phone)
 
-        self._sessions[phone] = SessionEntry(thread_id=thread_id, created_at=now, last_accessed=now)
+        self._sessions[phone] = SessionEntry(
+            thread_id=thread_id, created_at=now, last_accessed=now, checked_at=time.monotonic()
+        )
 
         # Enhanced logging for MVP user tracking
         if is_new_session:
@@ -171,6 +198,62 @@ class SessionManager:
         """
         return self._remove_session_entry(phone)
 
+    async def get_session_async(self, phone: str) -> Optional[str]:
+        """Get session thread_id for phone number, consulting the shared store.
+
+        A local entry checked against the store within the last
+        config.store_refresh_seconds is used as is. Otherwise the store is
+        read and its answer replaces the local entry. If the store cannot be
+        read, the local entry is used.
+
+        Args:
+            phone: Phone number to look up session for.
+
+        Returns:
+            Optional[str]: Thread ID if session exists and is valid, None otherwise.
+        """
+        if self._store is None:
+            return self.get_session(phone)
+
+        entry = self._sessions.get(phone)
+        now = time.monotonic()
+        if entry is not None and now - entry.checked_at < self.config.store_refresh_seconds:
+            return self.get_session(phone)
+
+        try:
+            thread_id = await self._store.get(phone)
+        except SessionStoreError:
+            if entry is not None:
+                # Don't retry the store on every message while it is down
+                entry.checked_at = now
+            return self.get_session(phone)
+
+        return self._adopt_stored_session(phone, thread_id)
+
+    async def set_session_async(self, phone: str, thread_id: str) -> None:
+        """Set session thread_id for phone number and write it to the shared store.
+
+        Args:
+            phone: Phone number to set session for.
+            thread_id: OpenAI thread ID to associate with phone.
+        """
+        self.set_session(phone, thread_id)
+        if self._store is not None:
+            await self._store.set(phone, thread_id)
+
+    async def remove_session_async(self, phone: str) -> bool:
+        """Remove session for phone number here and from the shared store.
+
+        Args:
+            phone: Phone number to remove session for.
+
+        Returns:
+            bool: True if this process had a session, False otherwise.
+        """
+        if self._store is not None:
+            await self._store.delete(phone)
+        return self.remove_session(phone)
+
     def cleanup_expired_sessions(self) -> int:
         """Remove all expired sessions.
 
@@ -274,11 +357,13 @@ class SessionManager:
             'active_sessions': len(self._sessions),
             'total_sessions_created': self._total_sessions_created,
             'total_sessions_expired': self._total_sessions_expired,
+            'total_sessions_evicted': self._total_sessions_evicted,
             'estimated_memory_bytes': self.estimate_memory_usage(),
             'last_cleanup': self._last_cleanup.isoformat(),
             'config': {
                 'ttl_seconds': self.config.ttl_seconds,
                 'cleanup_interval': self.config.cleanup_interval,
+                'max_sessions': self.config.max_sessions,
             },
         }
 
@@ -311,6 +396,45 @@ class SessionManager:
 
         return migrated_count
 
+    def _adopt_stored_session(self, phone: str, thread_id: Optional[str]) -> Optional[str]:
+        """Make the local session for a phone match what the shared store holds.
+
+        Args:
+            phone: Phone number that was looked up.
+            thread_id: Thread ID read from the store, None if it has none.
+
+        Returns:
+            Optional[str]: Thread ID now held for the phone, None if there is none.
+        """
+        entry = self._sessions.get(phone)
+        if not thread_id:
+            # Reset or expired on another worker
+            self._remove_session_entry(phone)
+            return None
+
+        if entry is not None and entry.thread_id == thread_id and not self._is_expired(entry):
+            entry.checked_at = time.monotonic()
+            return self.get_session(phone)
+
+        if entry is None:
+            self._evict_if_full()
+        else:
+            self._sessions.move_to_end(phone)
+        now = datetime.now()
+        self._sessions[phone] = SessionEntry(
+            thread_id=thread_id, created_at=now, last_accessed=now, checked_at=time.monotonic()
+        )
+        self._total_sessions_created += 1
+        log.info(
+            "session_adopted_from_store",
+            extra={
+                "phone_hash": phone[-4:] if phone else "unknown",
+                "thread_id_prefix": thread_id[:10],
+                "replaced_local": entry is not None,
+            },
+        )
+        return thread_id
+
     def _is_expired(self, entry: SessionEntry) -> bool:
         """Check if session entry has expired.
 
@@ -341,6 +465,20 @@ class SessionManager:
             return True
         return False
 
+    def _evict_if_full(self) -> None:
+        """Evict least recently used sessions until there is room for one more."""
+        while len(self._sessions) >= self.config.max_sessions:
+            phone, entry = self._sessions.popitem(last=False)
+            self._total_sessions_evicted += 1
+            log.info(
+                "session_evicted_lru",
+                extra={
+                    "phone_hash": phone[-4:] if phone else "unknown",
+                    "thread_id_prefix": entry.thread_id[:10],
+                    "max_sessions": self.config.max_sessions,
+                },
+            )
+
     def _maybe_cleanup(self) -> None:
         """Run cleanup if enough time has passed since last cleanup."""
         time_since_cleanup = datetime.now() - self._last_cleanup
@@ -0,0 +1,137 @@
+"""Shared session storage for running several app workers.
+
+SessionManager keeps sessions in process memory. When SESSION_REDIS_URL is set,
+sessions are also written to Redis so a message routed to a different worker
+(or arriving after a restart) continues the same conversation thread. The
+asyncio Redis client is used, so store calls never block the event loop.
+"""
+
+import hashlib
+import logging
+import os
+from typing import Optional
+
+# Redis is only needed for multi-worker deployments - optional dependency
+try:
+    import redis
+    import redis.asyncio
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+log = logging.getLogger("whatspr.session")
+
+
+class SessionStoreError(Exception):
+    """The shared session store could not be read."""
+
+
+class RedisSessionStore:
+    """Phone to thread_id mapping stored in Redis with a TTL.
+
+    Keys hold a digest of the phone number rather than the number itself, so
+    the shared store does not expose sender phone numbers.
+
+    Failed writes are logged and skipped, and failed reads raise
+    SessionStoreError so callers can keep their local session. An unavailable
+    Redis therefore degrades to per-worker sessions instead of failing the
+    webhook.
+
+    Args:
+        url: Redis connection URL, e.g. redis://localhost:6379/0.
+        ttl_seconds: Expiry applied to every stored session.
+        key_prefix: Prefix for session keys.
+    """
+
+    def __init__(self, url: str, ttl_seconds: float, key_prefix: str = "sess:"):
+        """Connect to Redis.
+
+        Args:
+            url: Redis connection URL.
+            ttl_seconds: Expiry applied to every stored session.
+            key_prefix: Prefix for session keys.
+
+        Raises:
+            RuntimeError: If the redis package is not installed.
+        """
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("SESSION_REDIS_URL is set but the redis package is not installed")
+        self._client = redis.asyncio.Redis.from_url(
+            url, decode_responses=True, socket_timeout=0.5, socket_connect_timeout=0.5
+        )
+        self._ttl = max(1, int(ttl_seconds))
+        self._prefix = key_prefix
+
+    def _key(self, phone: str) -> str:
+        """Build the Redis key for a phone number.
+
+        Args:
+            phone: Sender phone number.
+
+        Returns:
+            str: Key prefix followed by 16 hex characters of a BLAKE2b digest.
+        """
+        return self._prefix + hashlib.blake2b(phone.encode(), digest_size=8).hexdigest()
+
+    async def get(self, phone: str) -> Optional[str]:
+        """Look up the thread_id stored for a phone number.
+
+        Args:
+            phone: Phone number to look up.
+
+        Returns:
+            Optional[str]: Stored thread_id, or None if absent.
+
+        Raises:
+            SessionStoreError: If Redis could not be reached.
+        """
+        try:
+            return await self._client.get(self._key(phone))
+        except redis.RedisError as e:
+            log.warning(f"session_store_get_failed error={type(e).__name__}")
+            raise SessionStoreError(str(e)) from e
+
+    async def set(self, phone: str, thread_id: str) -> None:
+        """Store the thread_id for a phone number, resetting its TTL.
+
+        Args:
+            phone: Phone number to store.
+            thread_id: OpenAI thread ID for the conversation.
+        """
+        try:
+            await self._client.set(self._key(phone), thread_id, ex=self._ttl)
+        except redis.RedisError as e:
+            log.warning(f"session_store_set_failed error={type(e).__name__}")
+
+    async def delete(self, phone: str) -> None:
+        """Remove the stored session for a phone number.
+
+        Args:
+            phone: Phone number to remove.
+        """
+        try:
+            await self._client.delete(self._key(phone))
+        except redis.RedisError as e:
+            log.warning(f"session_store_delete_failed error={type(e).__name__}")
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self._client.aclose()
+
+
+def session_store_from_env(ttl_seconds: float) -> Optional[RedisSessionStore]:
+    """Create the shared session store configured by SESSION_REDIS_URL.
+
+    Args:
+        ttl_seconds: Session TTL, used as the Redis key expiry.
+
+    Returns:
+        Optional[RedisSessionStore]: Store instance, or None when
+            SESSION_REDIS_URL is not set.
+    """
+    url = os.getenv("SESSION_REDIS_URL")
+    if not url:
+        return None
+    return RedisSessionStore(url, ttl_seconds)
@@ -116,7 +116,7 @@ def test_message_processing():
 
             if tool_calls:
                 for tool in tool_calls:
-                    colored_print(f"    - {tool.get('name')}: {tool.get('arguments')}", "blue")
+                    colored_print(f"    - {tool.name}: {tool.arguments}", "blue")
 
             time.sleep(1)
 
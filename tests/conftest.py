@@ -7,8 +7,11 @@ import pytest
 import uuid
 from unittest.mock import patch, Mock
 from app.timeout_config import TimeoutManager
-from app.agent_endpoint import session_manager
+import app.agent_endpoint as agent_endpoint
+from app.agent_endpoint import session_manager, _FIRST_TURN_CACHE, _RECENT_REPLIES
 import app.agent_runtime as agent_runtime
+from app.agent_runtime import ToolCall
+import app.aggregator as aggregator
 
 
 @pytest.fixture(autouse=True)
@@ -18,12 +21,23 @@ def reset_session_manager():
     session_manager._sessions.clear()
     session_manager._total_sessions_created = 0
     session_manager._total_sessions_expired = 0
+    session_manager._total_sessions_evicted = 0
     session_manager._last_cleanup = session_manager._last_cleanup.__class__.now()
+    _FIRST_TURN_CACHE.clear()
+    _RECENT_REPLIES.clear()
+    agent_endpoint._metrics_cache = (0.0, None)
     yield
     # Clean up after test
     session_manager._sessions.clear()
 
 
+@pytest.fixture(autouse=True)
+def disable_message_coalescing(monkeypatch):
+    """Process each webhook immediately; coalescing tests opt back in."""
+    monkeypatch.setattr(aggregator, "COALESCE_WINDOW", 0)
+    aggregator._pending.clear()
+
+
 @pytest.fixture(autouse=True)
 def reset_timeout_manager():
     """Reset TimeoutManager singleton state between tests."""
@@ -141,11 +155,11 @@ def mock_agent_runtime():
                 for keyword in ["funding", "raised", "million", "techcorp"]
             ):
                 tool_calls = [
-                    {"name": "save_slot", "arguments": {"name": "company", "value": "TechCorp"}},
-                    {
-                        "name": "save_slot",
-                        "arguments": {"name": "announcement_type", "value": "funding"},
-                    },
+                    ToolCall(name="save_slot", arguments={"name": "company", "value": "TechCorp"}),
+                    ToolCall(
+                        name="save_slot",
+                        arguments={"name": "announcement_type", "value": "funding"},
+                    ),
                 ]
 
             response = f"Thank you for that information about {message[:30]}{'...' if len(message) > 30 else ''}. I'll help you create an announcement."
@@ -1,2 +1,42 @@
-def test_dummy():
-    assert True
+import importlib.util
+import inspect
+
+from app.agent_runtime import create_thread, run_thread
+
+
+def test_runtime_is_single_agent_implementation():
+    assert importlib.util.find_spec("app.agent") is None
+    assert inspect.getsourcefile(run_thread).endswith("agent_runtime.py")
+    assert inspect.getsourcefile(create_thread).endswith("agent_runtime.py")
+
+
+def _webhook_request(content_type, body):
+    from starlette.requests import Request
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(b"content-type", content_type.encode())],
+    }
+    return Request(scope, receive)
+
+
+def test_read_message_fields_repeated_field_keeps_last_value():
+    import asyncio
+
+    from app.agent_endpoint import read_message_fields
+
+    body = b"From=%2B100&Body=first&AccountSid=AC1&Body=hello+w%C3%B6rld"
+    urlencoded = _webhook_request("application/x-www-form-urlencoded", body)
+    assert asyncio.run(read_message_fields(urlencoded)) == ("+100", "hello wörld")
+
+    multipart = _webhook_request(
+        "multipart/form-data; boundary=x",
+        b"--x\r\nContent-Disposition: form-data; name=\"From\"\r\n\r\n+100\r\n"
+        b"--x\r\nContent-Disposition: form-data; name=\"Body\"\r\n\r\nfirst\r\n"
+        b"--x\r\nContent-Disposition: form-data; name=\"Body\"\r\n\r\nhello\r\n--x--\r\n",
+    )
+    assert asyncio.run(read_message_fields(multipart)) == ("+100", "hello")
@@ -0,0 +1,252 @@
+"""Agent endpoint caching and per-sender coordination tests.
+
+Covers the first-turn reply cache, duplicate-delivery handling, the per-phone
+turn lock and the health metrics cache.
+"""
+
+import pytest
+import asyncio
+import time
+from unittest.mock import patch
+from urllib.parse import urlencode
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.main import app
+from app.agent_endpoint import session_manager
+
+
+def webhook_request(phone, body):
+    """Build a Twilio-style urlencoded webhook request for agent_hook."""
+    data = urlencode({"From": phone, "Body": body}).encode()
+
+    async def receive():
+        return {"type": "http.request", "body": data, "more_body": False}
+
+    headers = [(b"content-type", b"application/x-www-form-urlencoded")]
+    return Request({"type": "http", "method": "POST", "headers": headers}, receive)
+
+
+class TestAgentEndpointCaching:
+    """Test caches and locks that keep repeated work off the assistant."""
+
+    def setup_method(self, method):
+        """Set up test client."""
+        self.client = TestClient(app)
+        self.test_phone = "+1234567890"
+
+    def test_first_turn_cache_reuses_menu_reply(self):
+        """Menu openings are served from cache once a real reply was seen."""
+        from app import agent_endpoint
+
+        intent = agent_endpoint.MENU_SELECTIONS["1"]
+        calls = {"run": 0}
+
+        async def fake_run(thread_id, message, timeout_seconds=None):
+            calls["run"] += 1
+            if calls["run"] == 1:
+                return agent_endpoint.TIMEOUT_FALLBACK_REPLY, "thread_fallback", []
+            return "Great, tell me about the round.", "thread_first", []
+
+        with patch("app.agent_endpoint.run_thread_with_retry", side_effect=fake_run):
+            with patch(
+                "app.agent_endpoint.create_seeded_thread", return_value="thread_seeded"
+            ) as mock_seed:
+                # Fallback replies are never cached
+                asyncio.run(agent_endpoint.run_first_turn(intent))
+                assert intent not in agent_endpoint._FIRST_TURN_CACHE
+
+                first = asyncio.run(agent_endpoint.run_first_turn(intent))
+                second = asyncio.run(agent_endpoint.run_first_turn(intent))
+
+        assert first == ("Great, tell me about the round.", "thread_first", [])
+        assert second == ("Great, tell me about the round.", "thread_seeded", [])
+        assert calls["run"] == 2
+        seeded_messages = mock_seed.call_args.args[0]
+        assert [m["role"] for m in seeded_messages] == ["user", "assistant"]
+
+    def test_first_turn_cache_hit_falls_back_when_seeding_fails(self):
+        """A failed seeded-thread creation falls back to a normal assistant run."""
+        from app import agent_endpoint
+
+        intent = agent_endpoint.MENU_SELECTIONS["2"]
+        agent_endpoint._check_first_turn_version()
+        agent_endpoint._FIRST_TURN_CACHE[intent] = (
+            time.monotonic() + 60,
+            "Tell me about the product.",
+            (),
+        )
+
+        async def fake_run(thread_id, message, timeout_seconds=None):
+            assert thread_id is None
+            assert 0 < timeout_seconds <= agent_endpoint.get_max_ai_processing_time()
+            return "Fresh reply.", "thread_fresh", []
+
+        with patch("app.agent_endpoint.run_thread_with_retry", side_effect=fake_run) as mock_run:
+            with patch(
+                "app.agent_endpoint.create_seeded_thread", side_effect=RuntimeError("API down")
+            ):
+                result = asyncio.run(agent_endpoint.run_first_turn(intent))
+
+        assert result == ("Fresh reply.", "thread_fresh", [])
+        assert mock_run.call_count == 1
+
+    def test_first_turn_cache_expires_and_follows_assistant_version(self):
+        """Cached openings are dropped after the TTL or when the prompt changes."""
+        from app import agent_endpoint
+
+        intent = agent_endpoint.MENU_SELECTIONS["3"]
+        version = ["asst_1", 1]
+        calls = {"run": 0}
+
+        async def fake_run(thread_id, message, timeout_seconds=None):
+            calls["run"] += 1
+            return f"Reply {calls['run']}.", f"thread_{calls['run']}", []
+
+        with patch("app.agent_endpoint.run_thread_with_retry", side_effect=fake_run):
+            with patch("app.agent_endpoint.create_seeded_thread", return_value="thread_seeded"):
+                with patch(
+                    "app.agent_runtime.assistant_version", side_effect=lambda: tuple(version)
+                ):
+                    asyncio.run(agent_endpoint.run_first_turn(intent))
+                    assert asyncio.run(agent_endpoint.run_first_turn(intent))[0] == "Reply 1."
+
+                    # Editing the prompt file invalidates the cached opening
+                    version[1] = 2
+                    assert asyncio.run(agent_endpoint.run_first_turn(intent))[0] == "Reply 2."
+                    assert calls["run"] == 2
+
+                    # An entry past its TTL is refreshed by a new run
+                    version[1] = 3
+                    with patch("app.agent_endpoint.FIRST_TURN_CACHE_TTL", 0):
+                        assert asyncio.run(agent_endpoint.run_first_turn(intent))[0] == "Reply 3."
+                    assert asyncio.run(agent_endpoint.run_first_turn(intent))[0] == "Reply 4."
+                    assert calls["run"] == 4
+
+    def test_duplicate_delivery_replays_recent_reply(self):
+        """A re-delivery waiting on the phone lock gets the reply without a new run."""
+        from app import agent_endpoint
+        from app.agent_runtime import ToolCall
+
+        calls = {"run": 0}
+        tool_call = ToolCall(name="save_headline", arguments={"headline": "News"})
+
+        async def fake_run(thread_id, message, timeout_seconds=None):
+            calls["run"] += 1
+            await asyncio.sleep(0.05)
+            return "Saved.", thread_id, [tool_call]
+
+        async def delivery():
+            async with agent_endpoint.phone_lock(self.test_phone):
+                return await agent_endpoint.run_thread_deduplicated("thread_dup", "Headline: News")
+
+        async def deliver_twice():
+            return await asyncio.gather(delivery(), delivery())
+
+        with patch("app.agent_endpoint.run_thread_with_retry", side_effect=fake_run):
+            original, duplicate = asyncio.run(deliver_twice())
+
+            assert calls["run"] == 1
+            assert original == ("Saved.", "thread_dup", [tool_call])
+            # Tool calls only run for the original delivery
+            assert duplicate == ("Saved.", "thread_dup", [])
+
+            # Once the replay window has passed, the same text is a new turn
+            with patch("app.agent_endpoint.RECENT_REPLY_TTL", 0):
+                agent_endpoint._RECENT_REPLIES.clear()
+                asyncio.run(agent_endpoint.run_thread_deduplicated("thread_dup", "Again"))
+                asyncio.run(agent_endpoint.run_thread_deduplicated("thread_dup", "Again"))
+            assert calls["run"] == 3
+
+    def test_duplicate_first_message_replays_new_session_reply(self):
+        """A re-delivered opening message replays the reply instead of a second run."""
+        calls = {"run": 0}
+
+        async def slow_run(thread_id, message, timeout_seconds=None):
+            calls["run"] += 1
+            await asyncio.sleep(0.05)
+            return "Welcome aboard.", "thread_new", []
+
+        async def deliver_twice():
+            from app import agent_endpoint
+
+            return await asyncio.gather(
+                agent_endpoint.agent_hook(webhook_request(self.test_phone, "Hi there")),
+                agent_endpoint.agent_hook(webhook_request(self.test_phone, "Hi there")),
+            )
+
+        with patch("app.agent_endpoint.run_thread_with_retry", side_effect=slow_run):
+            original, duplicate = asyncio.run(deliver_twice())
+
+        assert calls["run"] == 1
+        assert original.body == duplicate.body
+        assert b"Welcome aboard." in duplicate.body
+
+    def test_phone_lock_serializes_turns_per_sender(self):
+        """Turns from one sender run one at a time; other senders are not blocked."""
+        from app import agent_endpoint
+
+        order = []
+
+        async def turn(phone, name):
+            async with agent_endpoint.phone_lock(phone):
+                order.append(f"{name}-start")
+                await asyncio.sleep(0.02)
+                order.append(f"{name}-end")
+
+        async def run():
+            await asyncio.gather(
+                turn(self.test_phone, "a"), turn(self.test_phone, "b"), turn("+1999", "c")
+            )
+
+        asyncio.run(run())
+
+        assert order.index("a-end") < order.index("b-start")
+        assert order.index("c-start") < order.index("a-end")
+        assert not agent_endpoint._PHONE_LOCKS
+
+    def test_reset_during_running_turn_is_not_undone(self):
+        """A reset sent mid-turn waits for the turn, so the turn cannot restore the session."""
+        from app import agent_endpoint
+
+        def webhook(body):
+            return webhook_request(self.test_phone, body)
+
+        async def slow_run(thread_id, message, timeout_seconds=None):
+            await asyncio.sleep(0.05)
+            return "Noted.", thread_id, []
+
+        async def run():
+            turn = asyncio.create_task(agent_endpoint.agent_hook(webhook("Our headline")))
+            await asyncio.sleep(0.01)
+            reset = await agent_endpoint.agent_hook(webhook("reset"))
+            await turn
+            return reset
+
+        session_manager.set_session(self.test_phone, "thread_before_reset")
+        with patch("app.agent_endpoint.run_thread_with_retry", side_effect=slow_run):
+            reset_response = asyncio.run(run())
+
+        assert "Welcome to WhatsPR" in reset_response.body.decode()
+        assert session_manager.get_session(self.test_phone) is None
+
+    def test_health_metrics_cached_between_scrapes(self):
+        """Health endpoints reuse metrics briefly; forced cleanup refreshes them."""
+        with patch.object(
+            session_manager, "get_metrics", wraps=session_manager.get_metrics
+        ) as mock_metrics:
+            assert self.client.get("/health/sessions").status_code == 200
+            assert self.client.get("/health/sessions/details").status_code == 200
+            assert mock_metrics.call_count == 1
+
+            session_manager.set_session(self.test_phone, "thread_cached")
+            response = self.client.post("/health/sessions/cleanup")
+            assert response.json()["current_metrics"]["active_sessions"] == 1
+
+            response = self.client.get("/health/sessions")
+            assert response.json()["session_manager"]["metrics"]["active_sessions"] == 1
+            assert mock_metrics.call_count == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
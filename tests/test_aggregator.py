@@ -0,0 +1,112 @@
+import asyncio
+
+import app.aggregator as aggregator
+
+
+async def _burst(messages, gap=0.01):
+    tasks = []
+    for msg in messages:
+        tasks.append(asyncio.create_task(aggregator.coalesce("+100", msg)))
+        await asyncio.sleep(gap)
+    return await asyncio.gather(*tasks)
+
+
+def test_coalesce_disabled_passes_message_through():
+    assert asyncio.run(aggregator.coalesce("+100", "hi")) == "hi"
+
+
+def test_coalesce_joins_burst_into_first_message(monkeypatch):
+    monkeypatch.setattr(aggregator, "COALESCE_WINDOW", 0.2)
+    results = asyncio.run(_burst(["hi", "I need", "a funding round"]))
+    assert results == ["hi\nI need\na funding round", None, None]
+    assert not aggregator._pending
+
+
+def test_coalesce_closes_full_batch_early(monkeypatch):
+    monkeypatch.setattr(aggregator, "COALESCE_WINDOW", 5)
+    monkeypatch.setattr(aggregator, "MAX_BATCH_MESSAGES", 2)
+
+    async def run():
+        start = asyncio.get_running_loop().time()
+        results = await _burst(["a", "b"])
+        return results, asyncio.get_running_loop().time() - start
+
+    results, elapsed = asyncio.run(run())
+    assert results == ["a\nb", None]
+    assert elapsed < 1
+
+
+def test_standalone_message_skips_window(monkeypatch):
+    monkeypatch.setattr(aggregator, "COALESCE_WINDOW", 5)
+
+    async def run():
+        start = asyncio.get_running_loop().time()
+        result = await aggregator.coalesce("+100", "1", standalone=True)
+        return result, asyncio.get_running_loop().time() - start
+
+    result, elapsed = asyncio.run(run())
+    assert result == "1"
+    assert elapsed < 1
+    assert not aggregator._pending
+
+
+def test_standalone_message_closes_open_batch_instead_of_joining(monkeypatch):
+    monkeypatch.setattr(aggregator, "COALESCE_WINDOW", 5)
+    order = []
+
+    async def send(msg, standalone=False):
+        result = await aggregator.coalesce("+100", msg, standalone=standalone)
+        order.append(result)
+        return result
+
+    async def run():
+        start = asyncio.get_running_loop().time()
+        first = asyncio.create_task(send("hi"))
+        await asyncio.sleep(0.01)
+        await send("1", standalone=True)
+        await first
+        return asyncio.get_running_loop().time() - start
+
+    elapsed = asyncio.run(run())
+    # The earlier text goes first, and the menu choice is not merged into it
+    assert order == ["hi", "1"]
+    assert elapsed < 1
+
+
+def test_menu_choice_after_text_keeps_menu_mapping(monkeypatch):
+    from unittest.mock import AsyncMock, patch
+    from urllib.parse import urlencode
+
+    from starlette.requests import Request
+
+    import app.agent_endpoint as agent_endpoint
+
+    monkeypatch.setattr(aggregator, "COALESCE_WINDOW", 5)
+
+    def webhook(body):
+        data = urlencode({"From": "+100", "Body": body}).encode()
+
+        async def receive():
+            return {"type": "http.request", "body": data, "more_body": False}
+
+        headers = [(b"content-type", b"application/x-www-form-urlencoded")]
+        return Request({"type": "http", "method": "POST", "headers": headers}, receive)
+
+    async def run():
+        text = asyncio.create_task(agent_endpoint.agent_hook(webhook("hi")))
+        await asyncio.sleep(0.01)
+        await agent_endpoint.agent_hook(webhook("1"))
+        await text
+
+    first_turn = AsyncMock(return_value=("Funding!", "thread_1", []))
+    retry = AsyncMock(return_value=("Hello!", "thread_1", []))
+    with patch.object(agent_endpoint, "run_first_turn", first_turn):
+        with patch.object(agent_endpoint, "run_thread_with_retry", retry):
+            asyncio.run(run())
+
+    # The menu choice reached the assistant as its intent, not as "hi\n1"
+    assert [c.args for c in retry.await_args_list] == [
+        (None, "hi"),
+        ("thread_1", agent_endpoint.MENU_SELECTIONS["1"]),
+    ]
+    first_turn.assert_not_awaited()
@@ -10,7 +10,7 @@ from unittest.mock import patch, MagicMock
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.agent_endpoint import session_manager, USE_SESSION_MANAGER
+from app.agent_endpoint import session_manager
 from tests.utils.rate_limiter import RateLimitedTestCase
 
 
@@ -24,15 +24,13 @@ class TestAPIFailureRecovery(RateLimitedTestCase):
         self.test_phone = "+1234567890"
 
         # Reset session manager state
-        if USE_SESSION_MANAGER:
-            session_manager._sessions.clear()
+        session_manager._sessions.clear()
 
     def test_openai_timeout_preserves_session(self):
         """Test that OpenAI timeouts don't corrupt session state."""
         # Create initial session
         thread_id = "thread_timeout_test"
-        if USE_SESSION_MANAGER:
-            session_manager.set_session(self.test_phone, thread_id)
+        session_manager.set_session(self.test_phone, thread_id)
 
         # Mock OpenAI timeout
         with patch('app.agent_runtime.get_client') as mock_client:
@@ -55,9 +53,8 @@ class TestAPIFailureRecovery(RateLimitedTestCase):
             )
 
         # Verify session preserved after timeout
-        if USE_SESSION_MANAGER:
-            retrieved_thread = session_manager.get_session(self.test_phone)
-            assert retrieved_thread == thread_id, "Session should survive OpenAI timeout"
+        retrieved_thread = session_manager.get_session(self.test_phone)
+        assert retrieved_thread == thread_id, "Session should survive OpenAI timeout"
 
     def test_openai_network_error_recovery(self):
         """Test recovery from OpenAI network errors."""
@@ -108,9 +105,6 @@ class TestAPIFailureRecovery(RateLimitedTestCase):
 
     def test_session_manager_failure_graceful_degradation(self):
         """Test graceful degradation when session manager fails."""
-        if not USE_SESSION_MANAGER:
-            pytest.skip("Test requires session manager to be enabled")
-
         # Mock session manager failure
         with patch.object(session_manager, 'get_session') as mock_get:
             mock_get.side_effect = Exception("Session manager database error")
@@ -150,10 +144,9 @@ class TestAPIFailureRecovery(RateLimitedTestCase):
         phone3 = "+3333333333"
 
         # Set up sessions for all users
-        if USE_SESSION_MANAGER:
-            session_manager.set_session(phone1, "thread_1")
-            session_manager.set_session(phone2, "thread_2")
-            session_manager.set_session(phone3, "thread_3")
+        session_manager.set_session(phone1, "thread_1")
+        session_manager.set_session(phone2, "thread_2")
+        session_manager.set_session(phone3, "thread_3")
 
         # Mock failure for phone1 only
         def selective_failure(*args, **kwargs):
@@ -208,16 +201,12 @@ class TestAPIFailureRecovery(RateLimitedTestCase):
             assert response3.status_code == 200
 
         # Verify all sessions still exist
-        if USE_SESSION_MANAGER:
-            assert session_manager.get_session(phone1) == "thread_1"
-            assert session_manager.get_session(phone2) == "thread_2"
-            assert session_manager.get_session(phone3) == "thread_3"
+        assert session_manager.get_session(phone1) == "thread_1"
+        assert session_manager.get_session(phone2) == "thread_2"
+        assert session_manager.get_session(phone3) == "thread_3"
 
     def test_session_cleanup_during_api_failure(self):
         """Test session cleanup continues working during API failures."""
-        if not USE_SESSION_MANAGER:
-            pytest.skip("Test requires session manager")
-
         # Create mix of sessions
         active_phone = "+1111111111"
         failing_phone = "+2222222222"
@@ -276,8 +265,7 @@ class TestAPIFailureRecovery(RateLimitedTestCase):
     def test_reset_command_during_api_failure(self):
         """Test reset commands work even when API is failing."""
         # Set up session
-        if USE_SESSION_MANAGER:
-            session_manager.set_session(self.test_phone, "thread_to_reset")
+        session_manager.set_session(self.test_phone, "thread_to_reset")
 
         # Mock API failure
         with patch('app.agent_runtime.get_client') as mock_client:
@@ -291,15 +279,11 @@ class TestAPIFailureRecovery(RateLimitedTestCase):
             assert "hi" in response_text or "announcement" in response_text
 
         # Session should be cleared
-        if USE_SESSION_MANAGER:
-            retrieved = session_manager.get_session(self.test_phone)
-            assert retrieved is None
+        retrieved = session_manager.get_session(self.test_phone)
+        assert retrieved is None
 
     def test_memory_stability_during_failures(self):
         """Test memory usage doesn't grow during repeated failures."""
-        if not USE_SESSION_MANAGER:
-            pytest.skip("Test requires session manager")
-
         initial_metrics = session_manager.get_metrics()
         initial_memory = initial_metrics['estimated_memory_bytes']
 
@@ -324,6 +308,26 @@ class TestAPIFailureRecovery(RateLimitedTestCase):
         memory_growth = final_memory - initial_memory
         assert memory_growth < 10000, f"Excessive memory growth: {memory_growth} bytes"
 
+    def test_all_attempts_failed_creates_fallback_thread_for_new_session(self):
+        """A new conversation gets a thread and the error reply when every attempt fails."""
+        from app import agent_endpoint
+
+        async def failing_attempt(thread_id, user_msg, timeout_seconds):
+            raise RuntimeError("OpenAI unavailable")
+
+        with patch("app.agent_endpoint.run_single_attempt", side_effect=failing_attempt):
+            with patch(
+                "app.agent_runtime.create_thread", return_value="thread_fallback"
+            ) as mock_create:
+                new_session = asyncio.run(agent_endpoint.run_thread_with_retry(None, "Hi", 2.0))
+                existing = asyncio.run(
+                    agent_endpoint.run_thread_with_retry("thread_existing", "Hi", 2.0)
+                )
+
+        assert new_session == (agent_endpoint.ERROR_FALLBACK_REPLY, "thread_fallback", [])
+        assert existing == (agent_endpoint.ERROR_FALLBACK_REPLY, "thread_existing", [])
+        mock_create.assert_called_once_with()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
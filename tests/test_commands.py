@@ -1,5 +1,7 @@
 """Tests for command handling functionality."""
 
+from twilio.twiml.messaging_response import MessagingResponse
+
 from app.commands import maybe_command
 
 
@@ -28,3 +30,21 @@ def test_non_command():
     """Test that non-commands return None."""
     assert maybe_command("hello") is None
     assert maybe_command("this is a regular message") is None
+
+
+def test_command_token_matching():
+    """Test that only the first token is matched, case-insensitively."""
+    assert maybe_command("  HELP me please") is not None
+    assert maybe_command("helpful tips") is None
+    assert maybe_command("") is None
+    assert maybe_command("   ") is None
+
+
+def test_command_replies_match_twilio_rendering():
+    """Test that prerendered and slot-specific replies match MessagingResponse."""
+    expected = MessagingResponse()
+    expected.message("Session reset. Send any message to start again.")
+    assert maybe_command("/reset").body.decode("utf-8") == str(expected)
+
+    response = maybe_command("/help", "headline").body.decode("utf-8")
+    assert response.endswith("/example – example answer for headline</Message></Response>")
@@ -1,7 +1,51 @@
+from pathlib import Path
+
+import pytest
+
+import app.flow_loader as flow_loader
 from app.flow_loader import load_flow
 
 
+@pytest.fixture(autouse=True)
+def flow_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "flow-cache"
+    monkeypatch.setattr(flow_loader, "FLOW_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
 def test_load():
     spec = load_flow("flows/pr_intake.yaml")
     assert spec["flow_id"] == "pr_intake"
     assert len(spec["slots"]) == 6
+
+
+def test_load_uses_json_cache(tmp_path, flow_cache_dir):
+    flow = tmp_path / "flow.yaml"
+    flow.write_text(Path("flows/pr_intake.yaml").read_text())
+    first = load_flow(str(flow))
+    assert len(list(flow_cache_dir.glob("*.json"))) == 1
+    assert not list(tmp_path.glob("flow.yaml.*"))
+    assert load_flow(str(flow)) == first
+
+
+def test_cache_ignored_when_yaml_changes(tmp_path, flow_cache_dir):
+    flow = tmp_path / "flow.yaml"
+    flow.write_text(Path("flows/pr_intake.yaml").read_text())
+    load_flow(str(flow))
+    (cache,) = flow_cache_dir.glob("*.json")
+
+    # A hand-edited cache for the same YAML is not trusted either
+    cache.write_text('{"source_hash": "stale", "flow": {"flow_id": "tampered"}}')
+    assert load_flow(str(flow))["flow_id"] == "pr_intake"
+
+    flow.write_text(flow.read_text().replace("pr_intake", "pr_intake_v2"))
+    assert load_flow(str(flow))["flow_id"] == "pr_intake_v2"
+
+
+@pytest.mark.parametrize("extra", ["launch: 2024-01-01", "limits: {1: one}"])
+def test_spec_json_cannot_reproduce_is_not_cached(tmp_path, flow_cache_dir, extra):
+    flow = tmp_path / "flow.yaml"
+    flow.write_text(f"flow_id: odd\nmax_turns: 3\n{extra}\nslots:\n  - id: a\n    ask: A?\n")
+    spec = load_flow(str(flow))
+    assert not list(flow_cache_dir.glob("*.json"))
+    assert load_flow(str(flow)) == spec
@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from app.idle import is_idle
 
 
@@ -7,3 +8,9 @@ def test_idle():
     assert is_idle(old)
     recent = datetime.utcnow()
     assert not is_idle(recent)
+
+
+def test_idle_epoch_and_aware():
+    assert is_idle(time.time() - 7200)
+    assert not is_idle(time.time())
+    assert not is_idle(datetime.now(timezone.utc))
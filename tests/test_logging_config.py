@@ -0,0 +1,14 @@
+import json
+
+import structlog
+
+from app.logging_config import render_json
+
+
+def test_render_json_accepts_non_str_keys_and_wide_ints():
+    renderer = structlog.processors.JSONRenderer(serializer=render_json)
+    event = {"event": "save_slot", "value": 2**70, "counts": {1: "one"}}
+
+    rendered = json.loads(renderer(None, "info", event))
+
+    assert rendered == {"event": "save_slot", "value": 2**70, "counts": {"1": "one"}}
@@ -79,7 +79,7 @@ class TestAgentRuntimeMocked(MockedRateLimitedTestCase):
             
             assert reply is not None
             assert len(tools) > 0
-            assert tools[0]["name"] in ["save_slot", "save_headline"]
+            assert tools[0].name in ["save_slot", "save_headline"]
     
     @mock_fixture("api_errors", "api_errors") 
     def test_error_handling_with_mocks(self):
@@ -200,7 +200,7 @@ class TestEndToEndFlowMocked(MockedRateLimitedTestCase):
             
             # Should have tool calls
             assert len(tools) > 0
-            tool_names = [tool["name"] for tool in tools]
+            tool_names = [tool.name for tool in tools]
             assert any(name in ["save_slot", "save_headline"] for name in tool_names)
     
     def test_error_recovery_flow(self):
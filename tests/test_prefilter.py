@@ -1,6 +1,8 @@
 """Tests for message prefiltering functionality."""
 
-from app.prefilter import clean_message
+from twilio.twiml.messaging_response import MessagingResponse
+
+from app.prefilter import clean_message, empty_twiml, render_twiml, twiml, twiml_response
 
 
 def test_emoji_removal():
@@ -26,3 +28,25 @@ def test_normal_message():
     """Test that normal messages pass through correctly."""
     assert clean_message("Hello world") == "Hello world"
     assert clean_message("  This has spaces  ") == "This has spaces"
+
+
+def test_twiml_matches_twilio_rendering():
+    """Test that the templated TwiML matches Twilio's MessagingResponse output."""
+    text = "Tom & Jerry <b>raised</b> $5M > \"expected\" 🚀\nPress 1"
+    expected = MessagingResponse()
+    expected.message(text)
+    response = twiml(text)
+    assert response.body.decode("utf-8") == str(expected)
+    assert response.media_type == "application/xml"
+
+
+def test_empty_twiml_matches_twilio_rendering():
+    """Test that the empty reply matches an empty MessagingResponse."""
+    assert empty_twiml().body.decode("utf-8") == str(MessagingResponse())
+
+
+def test_prerendered_twiml_response_matches_twiml():
+    """Test that a prerendered reply produces the same response as twiml()."""
+    response = twiml_response(render_twiml("Please send text."))
+    assert response.body == twiml("Please send text.").body
+    assert response.media_type == "application/xml"
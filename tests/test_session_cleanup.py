@@ -7,7 +7,7 @@ All tests are designed to FAIL initially until implementation is complete.
 import pytest
 import asyncio
 import time
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from datetime import datetime, timedelta
 
 from app.agent_endpoint import agent_hook
@@ -146,6 +146,101 @@ class TestSessionManager:
         assert memory_bytes > 100
         assert memory_bytes < 1000  # Reasonable upper bound for test data
 
+    def test_session_limit_evicts_least_recently_used(self):
+        """Test the oldest-accessed session is evicted once max_sessions is reached."""
+        manager = SessionManager(
+            SessionConfig(ttl_seconds=300, cleanup_interval=60, max_sessions=3)
+        )
+        for i in range(3):
+            manager.set_session(f"+100000000{i}", f"thread_{i}")
+
+        # Touch the first session so the second becomes least recently used
+        assert manager.get_session("+1000000000") == "thread_0"
+
+        manager.set_session("+1000000003", "thread_3")
+
+        assert manager.get_session_count() == 3
+        assert manager.get_session("+1000000001") is None
+        assert manager.get_session("+1000000000") == "thread_0"
+        assert manager.get_metrics()['total_sessions_evicted'] == 1
+
+    def test_session_limit_validation(self):
+        """Test max_sessions must be positive."""
+        with pytest.raises(ValueError, match="Max sessions must be at least 1"):
+            SessionConfig(max_sessions=0)
+
+    @staticmethod
+    def _shared_store(shared):
+        """Build an async store double backed by a plain dict."""
+
+        class DictStore:
+            async def get(self, phone):
+                return shared.get(phone)
+
+            async def set(self, phone, thread_id):
+                shared[phone] = thread_id
+
+            async def delete(self, phone):
+                shared.pop(phone, None)
+
+        return DictStore()
+
+    @pytest.mark.asyncio
+    async def test_shared_store_continues_sessions_across_managers(self):
+        """Test a session set by one worker is found by another via the shared store."""
+        shared = {}
+        config = SessionConfig(ttl_seconds=300, cleanup_interval=60)
+        worker_a = SessionManager(config, store=self._shared_store(shared))
+        worker_b = SessionManager(config, store=self._shared_store(shared))
+
+        await worker_a.set_session_async("+1234567890", "thread_shared")
+        assert await worker_b.get_session_async("+1234567890") == "thread_shared"
+        assert worker_b.get_session_count() == 1
+        assert worker_b.get_metrics()['total_sessions_created'] == 1
+
+        await worker_b.remove_session_async("+1234567890")
+        assert "+1234567890" not in shared
+
+    @pytest.mark.asyncio
+    async def test_shared_store_changes_seen_after_refresh_interval(self):
+        """Test a worker re-reads the store once its local entry is no longer fresh."""
+        shared = {}
+        config = SessionConfig(ttl_seconds=300, cleanup_interval=60, store_refresh_seconds=60)
+        worker_a = SessionManager(config, store=self._shared_store(shared))
+        worker_b = SessionManager(config, store=self._shared_store(shared))
+        phone = "+1234567890"
+
+        await worker_a.set_session_async(phone, "thread_old")
+        assert await worker_b.get_session_async(phone) == "thread_old"
+
+        # Another worker starts a new thread; worker_b's fresh entry still wins
+        await worker_a.set_session_async(phone, "thread_new")
+        assert await worker_b.get_session_async(phone) == "thread_old"
+
+        worker_b._sessions[phone].checked_at -= 60
+        assert await worker_b.get_session_async(phone) == "thread_new"
+
+        # A reset on another worker removes the local copy too
+        await worker_a.remove_session_async(phone)
+        worker_b._sessions[phone].checked_at -= 60
+        assert await worker_b.get_session_async(phone) is None
+        assert worker_b.get_session_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_store_failure_keeps_local_session(self):
+        """Test an unreachable store falls back to the local session."""
+        from app.session_store import SessionStoreError
+
+        class DownStore:
+            async def get(self, phone):
+                raise SessionStoreError("connection refused")
+
+        config = SessionConfig(ttl_seconds=300, cleanup_interval=60, store_refresh_seconds=0)
+        manager = SessionManager(config, store=DownStore())
+        manager.set_session("+1234567890", "thread_local")
+
+        assert await manager.get_session_async("+1234567890") == "thread_local"
+
 
 class TestSessionIntegration:
     """Test session cleanup integration with existing agent endpoint."""
@@ -154,16 +249,17 @@ class TestSessionIntegration:
     def mock_request(self):
         """Create mock FastAPI request."""
         request = MagicMock(spec=Request)
+        request.headers = {"content-type": "multipart/form-data; boundary=test"}
         form_data = FormData([("From", "+1234567890"), ("Body", "Hello test message")])
-        request.form.return_value = asyncio.coroutine(lambda: form_data)()
+        request.form = AsyncMock(return_value=form_data)
         return request
 
     @pytest.mark.asyncio
     async def test_session_manager_integration_with_agent_hook(self, mock_request):
         """Test SessionManager integration with existing agent_hook."""
         with patch('app.agent_endpoint.session_manager') as mock_manager:
-            mock_manager.get_session.return_value = None
-            mock_manager.set_session.return_value = None
+            mock_manager.get_session_async = AsyncMock(return_value=None)
+            mock_manager.set_session_async = AsyncMock(return_value=None)
 
             # Mock the AI processing
             with patch('app.agent_endpoint.run_thread_with_retry') as mock_ai:
@@ -172,21 +268,22 @@ class TestSessionIntegration:
                 response = await agent_hook(mock_request)
 
                 # Verify session manager was called
-                mock_manager.get_session.assert_called_once_with("+1234567890")
-                mock_manager.set_session.assert_called_once_with("+1234567890", "thread_123")
+                mock_manager.get_session_async.assert_awaited_once_with("+1234567890")
+                mock_manager.set_session_async.assert_awaited_once_with("+1234567890", "thread_123")
 
     @pytest.mark.asyncio
     async def test_session_reset_clears_from_manager(self, mock_request):
         """Test reset command clears session from manager."""
         # Update request for reset command
         form_data = FormData([("From", "+1234567890"), ("Body", "reset")])
-        mock_request.form.return_value = asyncio.coroutine(lambda: form_data)()
+        mock_request.form = AsyncMock(return_value=form_data)
 
         with patch('app.agent_endpoint.session_manager') as mock_manager:
+            mock_manager.remove_session_async = AsyncMock(return_value=True)
             response = await agent_hook(mock_request)
 
             # Verify session was cleared
-            mock_manager.remove_session.assert_called_once_with("+1234567890")
+            mock_manager.remove_session_async.assert_awaited_once_with("+1234567890")
 
     @pytest.mark.asyncio
     async def test_concurrent_session_access_thread_safety(self):
@@ -317,11 +414,17 @@ class TestConfigurationManagement:
     def test_environment_variable_configuration(self):
         """Test configuration can be loaded from environment variables."""
         with patch.dict(
-            'os.environ', {'SESSION_TTL_SECONDS': '600', 'SESSION_CLEANUP_INTERVAL': '120'}
+            'os.environ',
+            {
+                'SESSION_TTL_SECONDS': '600',
+                'SESSION_CLEANUP_INTERVAL': '120',
+                'SESSION_MAX_SESSIONS': '500',
+            },
         ):
             config = SessionConfig.from_env()
             assert config.ttl_seconds == 600
             assert config.cleanup_interval == 120
+            assert config.max_sessions == 500
 
     def test_default_configuration_values(self):
         """Test default configuration values are reasonable."""
@@ -354,26 +457,6 @@ class TestBackwardCompatibility:
         assert manager.get_session("+9876543210") == "thread_456"
         assert manager.get_session("+5555555555") is None
 
-    @pytest.mark.asyncio
-    async def test_gradual_rollout_compatibility(self):
-        """Test gradual rollout can fall back to old behavior."""
-        # Create mock request
-        mock_request = MagicMock()
-        form_data = {"From": "+1234567890", "Body": "test message"}
-        mock_request.form.return_value = asyncio.coroutine(lambda: form_data)()
-
-        with patch('app.agent_endpoint.USE_SESSION_MANAGER', False):
-            # Should use old _sessions dict behavior
-            with patch('app.agent_endpoint._sessions', {}) as mock_sessions:
-                with patch('app.agent_endpoint.run_thread_with_retry') as mock_ai:
-                    mock_ai.return_value = ("Test response", "thread_123", [])
-
-                    response = await agent_hook(mock_request)
-
-                    # Should update old _sessions dict
-                    assert "+1234567890" in mock_sessions
-                    assert mock_sessions["+1234567890"] == "thread_123"
-
 
 class TestMonitoringAndObservability:
     """Test monitoring and observability features."""
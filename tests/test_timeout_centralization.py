@@ -212,6 +212,26 @@ class TestTimeoutIntegration:
                 call_kwargs = create_call.call_args.kwargs
                 assert call_kwargs.get('timeout') == 15
 
+    def test_run_thread_cancels_run_when_budget_runs_out(self):
+        """Test run_thread stops polling and cancels the run once its budget is spent."""
+        with patch('app.agent_runtime.get_client') as mock_get_client:
+            mock_client = MagicMock()
+            mock_get_client.return_value = mock_client
+
+            mock_run = MagicMock()
+            mock_run.status = "in_progress"
+            mock_run.id = "test_run_id"
+            mock_client.beta.threads.runs.create.return_value = mock_run
+            mock_client.beta.threads.runs.retrieve.return_value = mock_run
+
+            from app.agent_runtime import run_thread
+
+            with pytest.raises(RuntimeError, match="cancelled"):
+                run_thread(None, "test message", timeout_seconds=0.3)
+
+            mock_client.beta.threads.runs.cancel.assert_called_once()
+            assert mock_client.beta.threads.runs.cancel.call_args.kwargs["run_id"] == "test_run_id"
+
     def test_agent_endpoint_uses_centralized_timeouts(self):
         """Test agent_endpoint uses TimeoutManager for retry logic."""
         with patch('app.agent_endpoint.timeout_manager') as mock_manager:
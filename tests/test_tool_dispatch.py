@@ -0,0 +1,63 @@
+"""Tool-call dispatch tests for the agent endpoint."""
+
+import asyncio
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, select
+
+import app.tools_atomic as tools_atomic
+from app.agent_endpoint import execute_tool_calls
+from app.agent_runtime import ToolCall
+from app.models import Answer
+
+
+@pytest.fixture
+def answer_db(tmp_path, monkeypatch):
+    """Point the atomic tools at an empty database."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'answers.db'}")
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(tools_atomic, "engine", engine)
+    monkeypatch.setenv("DEFAULT_SESSION_ID", "1")
+    return engine
+
+
+def test_repeated_slot_saves_keep_final_value(answer_db):
+    """Two saves to one slot in a turn leave one row holding the later value."""
+    for turn in range(20):
+        calls = [
+            ToolCall(name="save_headline", arguments={"value": f"draft {turn}"}),
+            ToolCall(name="save_key_facts", arguments={"value": f"facts {turn}"}),
+            ToolCall(name="save_headline", arguments={"value": f"final {turn}"}),
+        ]
+        asyncio.run(execute_tool_calls(calls, "thread_test"))
+
+        with Session(answer_db) as db:
+            headlines = db.exec(select(Answer).where(Answer.field == "headline")).all()
+        assert [answer.value for answer in headlines] == [f"final {turn}"]
+
+
+def test_finish_runs_after_saves_and_same_tool_calls_keep_order():
+    """Different tools overlap, one tool's calls stay ordered, finish runs last."""
+    from unittest.mock import patch
+
+    events = []
+
+    async def fake_execute(call, thread_prefix, total_tools):
+        label = f"{call.name}:{call.arguments.get('value', '')}"
+        events.append(f"start {label}")
+        await asyncio.sleep(0.01)
+        events.append(f"end {label}")
+
+    calls = [
+        ToolCall(name="finish"),
+        ToolCall(name="save_headline", arguments={"value": "draft"}),
+        ToolCall(name="save_quotes", arguments={"value": "quote"}),
+        ToolCall(name="save_headline", arguments={"value": "final"}),
+    ]
+    with patch("app.agent_endpoint.execute_tool_call", side_effect=fake_execute):
+        asyncio.run(execute_tool_calls(calls, "thread_test"))
+
+    assert events.index("end save_headline:draft") < events.index("start save_headline:final")
+    # Saves to different slots run concurrently
+    assert events.index("start save_quotes:quote") < events.index("end save_headline:draft")
+    assert events[-2:] == ["start finish:", "end finish:"]